@@ -0,0 +1,109 @@
+"""
+Benchmark the startup cost of the package: how long importing
+it takes and how long the first call to stem takes, each in a
+fresh interpreter.
+
+Run from the repository root, for example::
+
+    python -m benchmarks.bench_import --output import.json
+    python -m benchmarks.bench_import --baseline import.json
+
+With --baseline the exit status is 1 if either median is more
+than --threshold above the baseline's.
+"""
+
+import argparse
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+
+
+# Prints the microseconds taken by the first stem; -X importtime
+# reports the import itself on stderr.
+_SCRIPT = '''
+import time
+import porter2stemmer
+start = time.perf_counter()
+porter2stemmer.stem('generously')
+print((time.perf_counter() - start) * 1e6)
+'''
+
+_IMPORT_TIME = re.compile(r'import time:\s+\d+ \|\s+(\d+) \| porter2stemmer$',
+                          re.MULTILINE)
+
+
+def measure_once():
+    """
+    Return the import time and first stem time in microseconds,
+    measured in a new interpreter.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                              _SCRIPT], capture_output=True, text=True,
+                             check=True)
+    import_time = int(_IMPORT_TIME.search(process.stderr).group(1))
+    return import_time, float(process.stdout)
+
+
+def run(repeat=20):
+    """
+    Measure repeat times and return the medians as a dict.
+    """
+    imports, stems = zip(*[measure_once() for _ in range(repeat)])
+    results = {'import_us': statistics.median(imports),
+               'first_stem_us': statistics.median(stems)}
+    print('import %8.0f us   first stem %6.0f us' % (
+        results['import_us'], results['first_stem_us']))
+
+    return {'python': platform.python_version(),
+            'machine': platform.machine(),
+            'repeat': repeat,
+            'results': results}
+
+
+def regressions(results, baseline, threshold):
+    """
+    Return the measurements more than the threshold
+    fraction above the baseline.
+    """
+    slow = []
+    for name, expected in sorted(baseline['results'].items()):
+        actual = results['results'].get(name)
+        if actual is not None and actual > expected * (1 + threshold):
+            slow.append((name, actual, expected))
+
+    return slow
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='interpreters to start, the median is kept')
+    parser.add_argument('--output', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare against these results')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed fractional slowdown')
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            slow = regressions(results, json.load(baseline), args.threshold)
+        for name, actual, expected in slow:
+            print('REGRESSION %s: %.0f us, baseline %.0f us' % (
+                name, actual, expected))
+        if slow:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
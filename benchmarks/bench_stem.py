@@ -0,0 +1,166 @@
+"""
+Benchmark Porter2Stemmer.stem and check it against a baseline.
+
+Run from the repository root, for example::
+
+    python -m benchmarks.bench_stem --output results.json
+    python -m benchmarks.bench_stem --baseline results.json
+
+Every scenario reports words per second, the best of several
+runs, and per-call latency percentiles. With --baseline the
+exit status is 1 if any scenario's throughput falls more than
+--threshold below the baseline's.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from porter2stemmer import Porter2Stemmer
+
+from .corpora import LONG, SHORT, make_corpus, make_vocabulary
+
+
+CACHE_SIZE = 65536
+PERCENTILES = (50, 90, 99)
+
+
+def _stemmers(mode):
+    """
+    Return a function that makes a stemmer ready to be timed
+    in the given cache mode.
+    """
+    if mode == 'uncached':
+        return lambda corpus: Porter2Stemmer()
+    elif mode == 'cold':
+        return lambda corpus: Porter2Stemmer(cache_size=CACHE_SIZE)
+    else:
+        def warm(corpus):
+            stemmer = Porter2Stemmer(cache_size=CACHE_SIZE)
+            for word in corpus:
+                stemmer.stem(word)
+            return stemmer
+        return warm
+
+
+def _throughput(make_stemmer, corpus, repeat):
+    best = None
+    for _ in range(repeat):
+        stem = make_stemmer(corpus).stem
+        start = time.perf_counter()
+        for word in corpus:
+            stem(word)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return len(corpus) / best
+
+
+def _latencies(make_stemmer, corpus):
+    stem = make_stemmer(corpus).stem
+    clock = time.perf_counter_ns
+    timings = []
+    for word in corpus:
+        start = clock()
+        stem(word)
+        timings.append(clock() - start)
+
+    timings.sort()
+    return dict(('p%d' % p, timings[min(len(timings) - 1,
+                                        len(timings) * p // 100)])
+                for p in PERCENTILES)
+
+
+def scenarios(tokens, vocabulary_size):
+    """
+    Yield the name and corpus of every benchmark scenario.
+    """
+    for length, syllables in (('short', SHORT), ('long', LONG)):
+        vocabulary = make_vocabulary(vocabulary_size, syllables)
+        for distribution in ('zipf', 'uniform'):
+            corpus = make_corpus(vocabulary, tokens, distribution)
+            for mode in ('uncached', 'cold', 'warm'):
+                name = '%s-%s-%s' % (length, distribution, mode)
+                yield name, mode, corpus
+
+
+def run(tokens=100000, vocabulary_size=20000, repeat=3, only=None):
+    """
+    Run the benchmarks and return their results as a dict.
+    """
+    results = {}
+    for name, mode, corpus in scenarios(tokens, vocabulary_size):
+        if only and only not in name:
+            continue
+        make_stemmer = _stemmers(mode)
+        results[name] = {
+            'words_per_sec': round(_throughput(make_stemmer, corpus, repeat)),
+            'latency_ns': _latencies(make_stemmer, corpus),
+        }
+        print('%-24s %10d words/s  p50 %6d ns  p99 %6d ns' % (
+            name, results[name]['words_per_sec'],
+            results[name]['latency_ns']['p50'],
+            results[name]['latency_ns']['p99']))
+
+    return {'python': platform.python_version(),
+            'machine': platform.machine(),
+            'tokens': tokens,
+            'vocabulary_size': vocabulary_size,
+            'results': results}
+
+
+def regressions(results, baseline, threshold):
+    """
+    Return the scenarios whose throughput is more than the
+    threshold fraction below the baseline.
+    """
+    slow = []
+    for name, expected in sorted(baseline['results'].items()):
+        actual = results['results'].get(name)
+        if actual is None:
+            continue
+        floor = expected['words_per_sec'] * (1 - threshold)
+        if actual['words_per_sec'] < floor:
+            slow.append((name, actual['words_per_sec'],
+                         expected['words_per_sec']))
+
+    return slow
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--tokens', type=int, default=100000,
+                        help='tokens in each corpus')
+    parser.add_argument('--vocabulary-size', type=int, default=20000,
+                        help='distinct words in each vocabulary')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per scenario, the best is kept')
+    parser.add_argument('--only', help='run only scenarios containing this')
+    parser.add_argument('--output', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare against these results')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='allowed fractional throughput drop')
+    args = parser.parse_args(argv)
+
+    results = run(args.tokens, args.vocabulary_size, args.repeat, args.only)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            slow = regressions(results, json.load(baseline), args.threshold)
+        for name, actual, expected in slow:
+            print('REGRESSION %s: %d words/s, baseline %d words/s' % (
+                name, actual, expected))
+        if slow:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
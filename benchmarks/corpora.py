@@ -0,0 +1,69 @@
+"""
+Reproducible synthetic corpora for benchmarking the stemmer.
+
+Words are built from random syllables and the suffixes the
+algorithm handles, from a fixed seed, so every run of a
+benchmark stems exactly the same tokens.
+"""
+
+import bisect
+import itertools
+import random
+
+
+ONSETS = ['', 'b', 'c', 'd', 'f', 'g', 'h', 'l', 'm', 'n', 'p', 'r', 's',
+          't', 'v', 'w', 'y', 'br', 'ch', 'cl', 'gr', 'pl', 'sh', 'st', 'tr']
+NUCLEI = ['a', 'e', 'i', 'o', 'u', 'y', 'ea', 'ee', 'ou', 'ai']
+CODAS = ['', 'b', 'd', 'g', 'l', 'm', 'n', 'r', 's', 't', 'x', 'ck', 'nd',
+         'ng', 'nt', 'rt', 'ss', 'st', 'll', 'tt']
+SUFFIXES = ['', '', '', 's', 'es', "'s", 'ed', 'ing', 'ly', 'edly', 'ingly',
+            'ies', 'ied', 'eed', 'er', 'ers', 'est', 'ness', 'ful', 'fully',
+            'ation', 'ational', 'ations', 'ization', 'izer', 'ize', 'ise',
+            'ive', 'iveness', 'ous', 'ously', 'ousness', 'ism', 'ist', 'ity',
+            'iti', 'able', 'ably', 'ible', 'ment', 'ments', 'ement', 'ence',
+            'ance', 'ent', 'ant', 'al', 'ally', 'alism', 'ical', 'icate',
+            'ative', 'ogi', 'ology', 'less', 'lessly', 'tional', 'enci']
+
+SHORT = (1, 1)
+LONG = (3, 5)
+
+
+def make_vocabulary(size, syllables=SHORT, seed=0):
+    """
+    Return a list of size distinct words of the given
+    range of syllables, made up from a fixed seed.
+    """
+    rng = random.Random(seed)
+    words = []
+    seen = set()
+
+    while len(words) < size:
+        stem = ''.join(''.join([rng.choice(ONSETS), rng.choice(NUCLEI),
+                                rng.choice(CODAS)])
+                       for _ in range(rng.randint(*syllables)))
+        word = stem + rng.choice(SUFFIXES)
+        if len(word) > 2 and word not in seen:
+            seen.add(word)
+            words.append(word)
+
+    return words
+
+
+def make_corpus(vocabulary, size, distribution='zipf', seed=0):
+    """
+    Draw size tokens from the vocabulary, either uniformly or
+    following Zipf's law as natural language roughly does.
+    """
+    rng = random.Random(seed)
+
+    if distribution == 'uniform':
+        return [rng.choice(vocabulary) for _ in range(size)]
+    elif distribution == 'zipf':
+        weights = itertools.accumulate(1.0 / rank for rank in
+                                       range(1, len(vocabulary) + 1))
+        cumulative = list(weights)
+        total = cumulative[-1]
+        return [vocabulary[bisect.bisect(cumulative, rng.random() * total)]
+                for _ in range(size)]
+    else:
+        raise ValueError('unknown distribution: %r' % distribution)
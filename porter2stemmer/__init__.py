@@ -1,6 +1,47 @@
 # -*- coding: utf-8 -*-
-from .porter2stemmer import Porter2Stemmer  # flake8: noqa
+from .porter2stemmer import Porter2Stemmer, stem  # noqa: F401
 
 __author__ = 'Evan Dempsey'
 __email__ = 'me@evandempsey.io'
 __version__ = '1.0'
+
+# Optional parts of the package, imported on first use so that
+# importing the package only loads the stemmer itself.
+_LAZY = {
+    'LRUCache': 'cache',
+    'ParallelStemmer': 'parallel',
+    'AsyncStemmer': 'aio',
+    'StemServer': 'server',
+    'StemClient': 'server',
+    'ProfilingPorter2Stemmer': 'profiling',
+    'TextStemmer': 'text',
+    'MappedStemmer': 'mapped',
+    'compile_stem_table': 'mapped',
+    'stem_array': 'vectorized',
+    'StemIndex': 'index',
+    'fast_stem': 'compiled',
+    'compile_stemmer': 'compiled',
+    'BytesStemmer': 'buffers',
+    'PersistentCache': 'persistent',
+    'stem_series': 'columns',
+    'stem_arrow': 'columns',
+    'InternedStemmer': 'interning',
+    'StemmedDocument': 'documents',
+    'Stemmer': 'backends',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError('module %r has no attribute %r'
+                             % (__name__, name))
+
+    from importlib import import_module
+    value = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,163 @@
+"""
+An asyncio facade that gathers concurrent stemming requests
+into batches and stems them off the event loop.
+"""
+
+import asyncio
+import time
+
+from .porter2stemmer import Porter2Stemmer
+
+
+# Each process that stems batches keeps its own cached stemmers,
+# one for each set of overrides, keyed by the sorted overrides.
+_stemmers = {(): Porter2Stemmer(cache_size=65536)}
+
+
+def _stem_words(words, overrides=()):
+    stemmer = _stemmers.get(overrides)
+    if stemmer is None:
+        stemmer = _stemmers[overrides] = Porter2Stemmer(
+            cache_size=65536, overrides=dict(overrides))
+    return stemmer.stem_many(words)
+
+
+class AsyncStemmer(object):
+    """
+    Stem words from coroutines without blocking the event loop.
+
+    Requests made within max_delay seconds of each other, up to
+    max_batch_size words, are stemmed together as one batch in
+    the executor, which defaults to the loop's thread pool. A
+    process pool can be passed instead. Once max_pending words
+    are queued or being stemmed, new requests wait for room.
+    Overrides are passed along with every batch, so they work
+    with either kind of executor.
+    """
+
+    def __init__(self, executor=None, max_batch_size=1024, max_delay=0.001,
+                 max_pending=65536, overrides=None):
+        if max_batch_size < 1 or max_pending < 1:
+            raise ValueError('max_batch_size and max_pending must be positive')
+
+        self.executor = executor
+        self.overrides = tuple(sorted((overrides or {}).items()))
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+
+        self._batch = []
+        self._batch_words = 0
+        self._timer = None
+        self._pending = 0
+        self._room = None
+        self._tasks = set()
+
+        self._requests = 0
+        self._words = 0
+        self._batches = 0
+        self._max_queue_depth = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    async def stem(self, word):
+        """
+        Stem a single word.
+        """
+        stems = await self.stem_batch([word])
+        return stems[0]
+
+    async def stem_batch(self, words):
+        """
+        Stem a list of words and return their stems in order.
+        The words may be stemmed along with other requests.
+        """
+        words = list(words)
+        if not words:
+            return []
+
+        if self._room is None:
+            self._room = asyncio.Event()
+            self._room.set()
+
+        while self._pending and self._pending + len(words) > self.max_pending:
+            self._room.clear()
+            await self._room.wait()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((words, future, time.perf_counter()))
+        self._batch_words += len(words)
+        self._pending += len(words)
+        self._max_queue_depth = max(self._max_queue_depth, self._pending)
+
+        if self._batch_words >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """
+        Send the requests gathered so far off as one batch.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._batch
+        self._batch = []
+        self._batch_words = 0
+
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        words = [word for request, future, started in batch
+                 for word in request]
+        loop = asyncio.get_running_loop()
+
+        try:
+            stems = await loop.run_in_executor(self.executor, _stem_words,
+                                               words, self.overrides)
+        except Exception as error:
+            for request, future, started in batch:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            finished = time.perf_counter()
+            position = 0
+            for request, future, started in batch:
+                end = position + len(request)
+                if not future.done():
+                    future.set_result(stems[position:end])
+                position = end
+
+                latency = finished - started
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+
+        self._requests += len(batch)
+        self._words += len(words)
+        self._batches += 1
+        self._pending -= len(words)
+        self._room.set()
+
+    def metrics(self):
+        """
+        Return a snapshot of the request, batch and queue
+        statistics as a dict. Latencies are in seconds.
+        """
+        return {'requests': self._requests,
+                'words': self._words,
+                'batches': self._batches,
+                'mean_batch_size': (float(self._words) / self._batches
+                                    if self._batches else 0.0),
+                'queue_depth': self._pending,
+                'max_queue_depth': self._max_queue_depth,
+                'mean_latency': (self._total_latency / self._requests
+                                 if self._requests else 0.0),
+                'max_latency': self._max_latency}
@@ -0,0 +1,312 @@
+"""
+A single Stemmer that runs on the fastest of several backends.
+
+Each backend is a way of stemming words: the Porter2Stemmer
+class itself, the compiled function from the compiled module,
+or a precomputed table from the mapped module. The first time
+a Stemmer is used it checks every available backend against the
+Porter2Stemmer reference on a sample of words, times them, and
+settles on the fastest one that gave the same stems. The choice
+is remembered in a JSON file, so later runs on the same host
+skip the check.
+"""
+
+import hashlib
+import io
+import json
+import os
+import platform
+import threading
+
+from .porter2stemmer import EXCEPTIONS, Porter2Stemmer
+
+
+# Words that exercise each step of the algorithm, the exceptional
+# forms and the R1 prefixes, for checking and timing backends.
+SAMPLE_WORDS = u"""
+caresses ponies ties caress cats feed agreed plastered bled motoring sing
+conflated troubled sized hopping tanned falling hissing fizzed failing filing
+happy sky relational conditional rational valenci hesitanci digitizer
+conformabli radicalli differentli vileli analogousli vietnamization
+predication operator feudalism decisiveness hopefulness callousness formaliti
+sensitiviti sensibiliti triplicate formative formalize electriciti electrical
+hopeful goodness revival allowance inference airliner gyroscopic adjustable
+defensible irritant replacement adjustment dependent adoption homologou
+communism activate angulariti homologous effective bowdlerize probate rate
+cease controll roll generously communication arsenal skies dying news inning
+proceed 'tis dog's dogs' yearly fluently geology luxuriating knee
+""".split() + [u'na\xefvet\xe9']
+
+
+class Backend(object):
+    """
+    A way of stemming words that a Stemmer can choose. Subclasses
+    say whether they are available on this host and whether their
+    stems follow the stemmer's overrides, and build a function that
+    stems one word, releasing anything it holds in unload.
+    """
+
+    name = None
+
+    # Whether the stems follow overrides added to the stemmer.
+    follows_overrides = True
+
+    def available(self, stemmer):
+        """
+        Return whether the backend can be used here to stem
+        like the stemmer.
+        """
+        return True
+
+    def key(self):
+        """
+        Return a string identifying the backend and anything its
+        speed or stems depend on, for the cached choice.
+        """
+        return self.name
+
+    def load(self, stemmer):
+        """
+        Return a function that stems one word like the stemmer.
+        """
+        raise NotImplementedError
+
+    def unload(self, stem):
+        """
+        Release what load opened for the function it returned.
+        """
+
+
+class PythonBackend(Backend):
+    """
+    The Porter2Stemmer class, which every other backend is
+    checked against.
+    """
+
+    name = 'python'
+
+    def load(self, stemmer):
+        return stemmer.stem
+
+
+class CompiledBackend(Backend):
+    """
+    The flat function generated by the compiled module.
+    """
+
+    name = 'compiled'
+
+    def load(self, stemmer):
+        from .compiled import compile_stemmer
+        return compile_stemmer(stemmer)
+
+
+class TableBackend(Backend):
+    """
+    A stem table written by compile_stem_table, looked up through
+    mmap, with the stemmer handling words not in the table.
+    """
+
+    name = 'table'
+    follows_overrides = False
+
+    def __init__(self, path):
+        self.path = path
+
+    def available(self, stemmer):
+        from .mapped import MappedStemmer, stemmer_fingerprint
+
+        if not os.path.isfile(self.path):
+            return False
+
+        # Only the sample words are checked before a backend is
+        # chosen, so the table must have been written by the same
+        # version of the package with the same exceptions.
+        try:
+            with MappedStemmer(self.path) as table:
+                return table.fingerprint == stemmer_fingerprint(stemmer)
+        except ValueError:
+            return False
+
+    def key(self):
+        return '%s:%s:%d' % (self.name, os.path.abspath(self.path),
+                             os.stat(self.path).st_mtime_ns)
+
+    def load(self, stemmer):
+        from .mapped import MappedStemmer
+        return MappedStemmer(self.path, fallback=stemmer).stem
+
+    def unload(self, stem):
+        stem.__self__.close()
+
+
+def default_cache_path():
+    """
+    Return where Stemmer remembers its choices by default.
+    """
+    root = os.environ.get('XDG_CACHE_HOME')
+    if not root:
+        root = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'porter2stemmer', 'backends.json')
+
+
+class Stemmer(object):
+    """
+    Stem words with the fastest backend that agrees with
+    Porter2Stemmer. The backend is chosen on first use, or by
+    calling select, and stem is then the backend's own function.
+    If no backend gives the same stems, it uses Porter2Stemmer.
+    """
+
+    # Number of words each backend stems when it is timed.
+    sample_size = 20000
+
+    def __init__(self, stemmer=None, backends=None, table=None,
+                 words=None, cache_path=None):
+        """
+        Pass a table file to consider looking stems up in it,
+        backends to choose from a list of your own, and words to
+        check the backends on instead of SAMPLE_WORDS. The choice
+        is remembered at cache_path, or in the user's cache
+        directory if it is None; pass False to always benchmark.
+        """
+        self.stemmer = stemmer or Porter2Stemmer()
+        if backends is None:
+            backends = [PythonBackend(), CompiledBackend()]
+            if table is not None:
+                backends.append(TableBackend(table))
+        self.backends = backends
+        self.words = list(words or SAMPLE_WORDS)
+        self.cache_path = (default_cache_path() if cache_path is None
+                           else cache_path)
+        self.backend = None
+        self.results = None
+        self._lock = threading.Lock()
+
+    def stem(self, word):
+        """
+        Stem the word, choosing a backend first if needed.
+        """
+        self.select()
+        return self.stem(word)
+
+    def stem_many(self, words):
+        """
+        Stem a batch of words and return the stems as a list.
+        Each distinct word is stemmed once.
+        """
+        self.select()
+        stem = self.stem
+        stems = dict((word, stem(word)) for word in set(words))
+
+        return [stems[word] for word in words]
+
+    def select(self):
+        """
+        Choose the backend, from the cached choice if there is
+        one and by benchmarking otherwise, and return its name.
+        """
+        with self._lock:
+            if self.backend is not None:
+                return self.backend.name
+
+            available = [backend for backend in self.backends
+                         if backend.available(self.stemmer)]
+            if self.stemmer.exceptions is not EXCEPTIONS:
+                available = [backend for backend in available
+                             if backend.follows_overrides]
+
+            key = self._cache_key(available)
+            name = self._read_choice(key)
+            backend = next((backend for backend in available
+                            if backend.name == name), None)
+            if backend is None:
+                self.results = self.benchmark(available)
+                backend = max(
+                    (backend for backend in available
+                     if self.results[backend.name]['conformance'] == 1.0),
+                    key=lambda backend:
+                    self.results[backend.name]['words_per_sec'],
+                    default=None)
+                if backend is None:
+                    backend = PythonBackend()
+                else:
+                    self._write_choice(key, backend.name)
+
+            self.stem = backend.load(self.stemmer)
+            self.backend = backend
+            return backend.name
+
+    def benchmark(self, backends=None):
+        """
+        Check and time the backends, or all available ones, on the
+        words, and return a dict of check_backend reports without
+        the mismatches, by backend name.
+        """
+        from .conformance import check_backend
+
+        if backends is None:
+            backends = [backend for backend in self.backends
+                        if backend.available(self.stemmer)]
+
+        reference = self.stemmer.stem_word
+        pairs = [(word, reference(word)) for word in self.words]
+        repeats = max(1, self.sample_size // max(1, len(pairs)))
+
+        results = {}
+        for backend in backends:
+            stem = backend.load(self.stemmer)
+            try:
+                report = check_backend(stem, pairs)
+                if report['conformance'] == 1.0:
+                    report = check_backend(stem, pairs * repeats)
+            finally:
+                backend.unload(stem)
+            del report['mismatches']
+            results[backend.name] = report
+
+        return results
+
+    def _cache_key(self, backends):
+        from . import __version__
+
+        exceptions = sorted(self.stemmer.exceptions.items())
+        parts = [platform.python_implementation(), platform.python_version(),
+                 platform.machine(), __version__,
+                 sorted(backend.key() for backend in backends),
+                 exceptions, self.words]
+        return hashlib.sha1(json.dumps(parts).encode('utf-8')).hexdigest()
+
+    def _read_choice(self, key):
+        if not self.cache_path:
+            return None
+
+        try:
+            with io.open(self.cache_path, encoding='utf-8') as cache:
+                return json.load(cache).get(key)
+        except (OSError, ValueError):
+            return None
+
+    def _write_choice(self, key, name):
+        if not self.cache_path:
+            return
+
+        try:
+            with io.open(self.cache_path, encoding='utf-8') as cache:
+                choices = json.load(cache)
+        except (OSError, ValueError):
+            choices = {}
+        choices[key] = name
+
+        # Write to a temporary file first so that processes starting
+        # at the same time never read a partly written cache.
+        temp_path = '%s.%d.tmp' % (self.cache_path, os.getpid())
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            with io.open(temp_path, 'w', encoding='utf-8') as cache:
+                cache.write(json.dumps(choices, indent=2, sort_keys=True))
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            pass
@@ -0,0 +1,115 @@
+"""
+Stem words held in bytes buffers without decoding the buffer.
+
+Tokens are located by offsets into the buffer and their stems are
+written into an output buffer. ASCII tokens go through the compiled
+stemming function, other tokens are decoded as UTF-8 and stemmed by
+the stemmer, and the stem of each distinct token is remembered as
+bytes, so repeated tokens are never decoded or encoded again.
+"""
+
+from .compiled import compile_stemmer
+from .porter2stemmer import Porter2Stemmer
+
+
+class BytesStemmer(object):
+    """
+    Stem UTF-8 encoded words, given as bytes, bytearrays or
+    memoryviews, and return the stems as bytes.
+    """
+
+    memo_size = 65536
+
+    def __init__(self, stemmer=None):
+        self.stemmer = stemmer or Porter2Stemmer()
+        self._fast_stem = compile_stemmer(self.stemmer)
+        self._stems = {}
+        self._exceptions = self.stemmer.exceptions
+
+    def _memo(self):
+        """
+        Return the remembered stems, forgetting them first if the
+        stemmer's overrides have changed since they were stemmed.
+        """
+        exceptions = self.stemmer.exceptions
+        if exceptions is not self._exceptions:
+            self._stems.clear()
+            self._exceptions = exceptions
+
+        return self._stems
+
+    def stem(self, word):
+        """
+        Stem a single UTF-8 encoded word.
+        """
+        word = bytes(word)
+        try:
+            return self._memo()[word]
+        except KeyError:
+            return self._stem_new(word)
+
+    def _stem_new(self, word):
+        if word.isascii():
+            stemmed = self._fast_stem(word.decode('ascii')).encode('ascii')
+        else:
+            stemmed = self.stemmer.stem(word.decode('utf-8')).encode('utf-8')
+
+        stems = self._stems
+        if len(stems) >= self.memo_size:
+            stems.clear()
+        stems[word] = stemmed
+        return stemmed
+
+    def stem_tokens(self, buffer, offsets):
+        """
+        Return the stems of the tokens of the buffer found at the
+        (start, end) offsets, as a list of bytes.
+        """
+        view = memoryview(buffer)
+        stems = self._memo()
+        stem_new = self._stem_new
+        results = []
+
+        for start, end in offsets:
+            word = view[start:end].tobytes()
+            try:
+                results.append(stems[word])
+            except KeyError:
+                results.append(stem_new(word))
+
+        return results
+
+    def stem_into(self, buffer, offsets, output, position=0):
+        """
+        Write the stems of the tokens of the buffer found at the
+        (start, end) offsets one after another into output, from
+        position on, and return their (start, end) offsets in it.
+
+        A bytearray output grows as needed; a writable memoryview
+        or other fixed size buffer must be large enough to take
+        every stem, or ValueError is raised.
+        """
+        view = memoryview(buffer)
+        target = output if isinstance(output, bytearray) else memoryview(output)
+        stems = self._memo()
+        stem_new = self._stem_new
+        spans = []
+
+        if position > len(target):
+            raise ValueError('position is past the end of the output buffer')
+
+        for start, end in offsets:
+            word = view[start:end].tobytes()
+            try:
+                stemmed = stems[word]
+            except KeyError:
+                stemmed = stem_new(word)
+
+            end = position + len(stemmed)
+            if end > len(target) and target is not output:
+                raise ValueError('output buffer is too small')
+            target[position:end] = stemmed
+            spans.append((position, end))
+            position = end
+
+        return spans
@@ -0,0 +1,82 @@
+"""
+A small bounded cache for memoizing stems.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """
+    A mapping of bounded size that evicts the least recently
+    used entry when it is full, and keeps count of hits,
+    misses and evictions.
+    """
+
+    def __init__(self, maxsize=65536):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for the key, marking it as
+        the most recently used, or the default if it is absent.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Cache the value for the key, evicting the least
+        recently used entry if the cache is full.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+            self._data[key] = value
+
+    def clear(self):
+        """
+        Empty the cache and reset its statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """
+        Return a snapshot of the cache statistics as a dict.
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'size': len(self._data),
+                    'maxsize': self.maxsize}
@@ -0,0 +1,228 @@
+"""
+Command line interface for stemming files or standard input.
+"""
+
+import argparse
+import io
+import sys
+
+from .porter2stemmer import Porter2Stemmer, read_overrides
+from .text import normalize, split_unfinished, tokenize
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='porter2stemmer',
+        description='Stem English text with the Porter2 algorithm.')
+    parser.add_argument(
+        'files', nargs='*', default=['-'], metavar='FILE',
+        help="files to stem, or '-' for standard input (the default)")
+    parser.add_argument(
+        '-t', '--tokens', action='store_true',
+        help='treat every input line as a single token instead of '
+             'splitting lines into words')
+    parser.add_argument(
+        '-f', '--format', choices=['stems', 'pairs'], default='stems',
+        help="write stems only, keeping the input's line structure, "
+             "or one 'word<TAB>stem' pair per line")
+    parser.add_argument(
+        '-w', '--workers', type=int, default=1,
+        help='number of worker processes to stem with')
+    parser.add_argument(
+        '-c', '--cache-size', type=int, default=65536,
+        help='number of stems to cache in each process, 0 to disable')
+    parser.add_argument(
+        '-b', '--buffer-size', type=int, default=1 << 20,
+        help='number of characters to read at a time')
+    parser.add_argument(
+        '-o', '--overrides', metavar='FILE',
+        help="file of words to protect or 'word,stem' overrides, "
+             "one per line")
+    parser.add_argument(
+        '--encoding', default='utf-8',
+        help='encoding of the input and output (default: utf-8)')
+
+    args = parser.parse_args(argv)
+    if args.buffer_size < 1:
+        parser.error('--buffer-size must be at least 1')
+
+    names = [name for name in args.files if name != '-']
+    if args.overrides:
+        names.append(args.overrides)
+    for name in names:
+        try:
+            io.open(name, 'rb').close()
+        except OSError as error:
+            parser.error("can't open '%s': %s" % (name, error.strerror))
+
+    return args
+
+
+def _open_input(name, encoding):
+    if name == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding=encoding,
+                                errors='replace')
+
+    return io.open(name, encoding=encoding, errors='replace')
+
+
+def _read_pieces(name, encoding, buffer_size, tokens):
+    """
+    Read the file in chunks of buffer_size characters and yield
+    pieces of it that end between words, or between lines if
+    tokens is true, so that a long line is never read whole.
+    """
+    stream = _open_input(name, encoding)
+    pending = ''
+    try:
+        while True:
+            chunk = stream.read(buffer_size)
+            if not chunk:
+                break
+            text = pending + chunk
+            if tokens:
+                end = text.rfind('\n') + 1
+                text, pending = text[:end], text[end:]
+            else:
+                text, pending = split_unfinished(text)
+            if text:
+                yield text
+        if pending:
+            yield pending
+    finally:
+        # Standard input's buffer is left open for the caller.
+        if name == '-':
+            stream.detach()
+        else:
+            stream.close()
+
+
+def _split_lines(text):
+    """
+    Split text into lines that keep their newlines, except
+    perhaps the last, splitting only on newlines as readline does.
+    """
+    lines = text.split('\n')
+    return [line + '\n' for line in lines[:-1]] + lines[-1:]
+
+
+def _tokenize(lines, tokens):
+    if tokens:
+        # Apostrophes around a token are dropped, so a token made
+        # only of them is skipped rather than stemmed to nothing.
+        words = (normalize(line.strip()).lower().strip("'")
+                 for line in lines)
+        return [[word] for word in words if word]
+
+    return [tokenize(line) for line in lines]
+
+
+class _Writer(object):
+    """
+    Write stems in either output format. Stems of words are written
+    with the input's line structure, which carries over from one
+    piece to the next when a piece ends partway through a line, and
+    stems of tokens one per line.
+    """
+
+    def __init__(self, output, output_format, tokens):
+        self.output = output
+        self.format = output_format
+        self.tokens = tokens
+        # Whether part of the current line has been read, and
+        # whether any of its stems have been written.
+        self.line_started = False
+        self.stems_written = False
+
+    def write(self, lines, documents, stemmed):
+        """
+        Write the stems of the words of the lines, where
+        the last line may be unfinished.
+        """
+        if self.format == 'pairs':
+            self.output.write(''.join('%s\t%s\n' % pair
+                                      for words, stems in zip(documents,
+                                                              stemmed)
+                                      for pair in zip(words, stems)))
+            return
+
+        if self.tokens:
+            self.output.write(''.join(' '.join(stems) + '\n'
+                                      for stems in stemmed))
+            return
+
+        parts = []
+        for line, stems in zip(lines, stemmed):
+            if stems:
+                if self.stems_written:
+                    parts.append(' ')
+                parts.append(' '.join(stems))
+                self.stems_written = True
+            if line.endswith('\n'):
+                parts.append('\n')
+                self.line_started = self.stems_written = False
+            elif line:
+                self.line_started = True
+        self.output.write(''.join(parts))
+
+    def end_file(self):
+        """
+        Finish the last line of a file that didn't end in a newline.
+        """
+        if self.format != 'pairs' and not self.tokens and self.line_started:
+            self.output.write('\n')
+        self.line_started = self.stems_written = False
+
+
+def main(argv=None):
+    """
+    Stem the files named on the command line, or standard
+    input, and write the stems to standard output.
+    """
+    args = _parse_args(argv)
+    output = io.TextIOWrapper(sys.stdout.buffer, encoding=args.encoding,
+                              write_through=False)
+
+    overrides = read_overrides(args.overrides) if args.overrides else None
+    if args.workers > 1:
+        from .parallel import ParallelStemmer
+        stemmer = ParallelStemmer(workers=args.workers,
+                                  chunk_size=max(1, 4096 // args.workers),
+                                  cache_size=args.cache_size or None,
+                                  overrides=overrides)
+        stem_documents = stemmer.stem_documents
+    else:
+        stemmer = Porter2Stemmer(cache_size=args.cache_size or None,
+                                 overrides=overrides)
+        stem_many = stemmer.stem_many
+
+        def stem_documents(documents):
+            # Stem the whole batch at once, then split it up again.
+            stems = iter(stem_many([w for words in documents for w in words]))
+            return [[next(stems) for w in words] for words in documents]
+
+    writer = _Writer(output, args.format, args.tokens)
+    try:
+        for name in args.files:
+            for text in _read_pieces(name, args.encoding, args.buffer_size,
+                                     args.tokens):
+                lines = _split_lines(text)
+                documents = _tokenize(lines, args.tokens)
+                writer.write(lines, documents, stem_documents(documents))
+            writer.end_file()
+        output.flush()
+    except BrokenPipeError:
+        # The reader went away, as with `| head`; stop quietly.
+        sys.stderr.close()
+        return 1
+    finally:
+        if args.workers > 1:
+            stemmer.close()
+        # Detach rather than close, so that the wrapper doesn't
+        # close standard output when it is garbage collected.
+        try:
+            output.detach()
+        except BrokenPipeError:
+            pass
+
+    return 0
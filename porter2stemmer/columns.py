@@ -0,0 +1,83 @@
+"""
+Stem pandas Series and pyarrow arrays of words. Requires pandas
+or pyarrow, which can be installed with the package's pandas
+and arrow extras.
+
+Columns are factorized into distinct words and codes pointing
+at them, each distinct word is stemmed once, and the stems are
+returned dictionary encoded, as a categorical Series or a
+DictionaryArray, so repeated stems are stored once.
+"""
+
+try:
+    import numpy
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:
+    pyarrow = None
+
+from .porter2stemmer import Porter2Stemmer
+
+
+def _stem_distinct(words, stemmer):
+    """
+    Stem the distinct words and return the distinct stems, and
+    for each word the position of its stem among them.
+    """
+    stem = stemmer.stem
+    positions = {}
+    codes = [positions.setdefault(stem(word), len(positions))
+             for word in words]
+
+    return list(positions), codes
+
+
+def stem_series(series, stemmer=None):
+    """
+    Stem a pandas Series of words and return a categorical Series
+    of stems with the same index and name. Missing values stay
+    missing.
+    """
+    if pandas is None:
+        raise ImportError('stem_series requires pandas')
+
+    stemmer = stemmer or Porter2Stemmer()
+    codes, words = pandas.factorize(series)
+    stems, stem_codes = _stem_distinct(words, stemmer)
+
+    # Missing values have the code -1, which picks the -1 on the end.
+    remap = numpy.array(stem_codes + [-1], dtype=codes.dtype)
+    categorical = pandas.Categorical.from_codes(remap[codes], stems)
+
+    return pandas.Series(categorical, index=series.index, name=series.name)
+
+
+def stem_arrow(array, stemmer=None):
+    """
+    Stem a pyarrow string array, dictionary array of strings or
+    chunked array of either, and return a DictionaryArray of
+    stems, or a ChunkedArray of them. Nulls stay null.
+    """
+    if pyarrow is None:
+        raise ImportError('stem_arrow requires pyarrow')
+
+    stemmer = stemmer or Porter2Stemmer()
+    if isinstance(array, pyarrow.ChunkedArray):
+        return pyarrow.chunked_array([stem_arrow(chunk, stemmer)
+                                      for chunk in array.chunks])
+
+    if not pyarrow.types.is_dictionary(array.type):
+        array = pyarrow.compute.dictionary_encode(array)
+
+    dictionary = array.dictionary
+    stems, stem_codes = _stem_distinct(dictionary.to_pylist(), stemmer)
+    indices = pyarrow.compute.take(
+        pyarrow.array(stem_codes, type=array.indices.type), array.indices)
+
+    return pyarrow.DictionaryArray.from_arrays(
+        indices, pyarrow.array(stems, type=dictionary.type))
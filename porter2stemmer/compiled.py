@@ -0,0 +1,277 @@
+"""
+Compile the stemming rules into a single specialized function.
+
+Porter2Stemmer runs the algorithm as a sequence of method calls
+with generic loops over the suffix tables. generate_source turns
+the same rules into the source of one flat function, with every
+step inlined and the suffix tables unrolled into nested ifs on
+the last letters of the word, and compile_stemmer executes it.
+
+fast_stem, the function compiled from the default rules, is
+built the first time it is imported from this module.
+"""
+
+import sys
+
+from .porter2stemmer import (Porter2Stemmer, _LETTER_CLASSES, _R1_PREFIXES,
+                             _STEP_1A_INVARIANTS, _STEP_2, _STEP_3, _STEP_4)
+
+
+_TEMPLATE = '''\
+def fast_stem(word, _exceptions=_exceptions, _classes=_LETTER_CLASSES,
+              _prefixes=_R1_PREFIXES, _invariants=_STEP_1A_INVARIANTS,
+              _doubles=_DOUBLES, _maxsize=_MAXSIZE):
+    stemmed = _exceptions(word)
+    if stemmed is not None:
+        return stemmed
+
+    n = len(word)
+    if n <= 2:
+        return word
+
+    # Remove the initial apostrophe and mark consonantal Ys.
+    if word[0] == "'":
+        word = word[1:]
+
+    if 'y' in word:
+        chars = None
+        if word[0] == 'y':
+            chars = list(word)
+            chars[0] = 'Y'
+        index = word.find('y', 1)
+        while index != -1:
+            if word[index - 1] in 'aeiou':
+                if chars is None:
+                    chars = list(word)
+                chars[index] = 'Y'
+            index = word.find('y', index + 1)
+        if chars is not None:
+            word = ''.join(chars)
+
+    # Find R1 and R2. Until step 1b adds letters the word stays a
+    # prefix of this one, so its letter classes remain valid.
+    classes = word.translate(_classes)
+    n = len(word)
+    r1 = _maxsize
+    r2 = _maxsize
+    if word.startswith(_prefixes):
+        end = next(len(prefix) for prefix in _prefixes
+                   if word.startswith(prefix))
+    else:
+        index = classes.find('vc')
+        end = index + 2 if index != -1 else n
+    if end < n:
+        r1 = end
+        index = classes.find('vc', r1)
+        if index != -1 and index + 2 < n:
+            r2 = index + 2
+
+    # Strip possessives.
+    if word.endswith("'s'"):
+        word = word[:-3]
+    elif word.endswith("'s"):
+        word = word[:-2]
+    elif word.endswith("'"):
+        word = word[:-1]
+
+    # Step 1a.
+    n = len(word)
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ied') or word.endswith('ies'):
+        word = word[:-3] + ('ie' if n <= 4 else 'i')
+    elif word.endswith('us') or word.endswith('ss'):
+        pass
+    elif word[-1] == 's' and classes.find('v', 0, n - 2) != -1:
+        word = word[:-1]
+
+    if word in _invariants:
+        return word
+
+    # Step 1b.
+    n = len(word)
+    if word.endswith('eed'):
+        if r1 <= n - 3:
+            word = word[:-3] + 'ee'
+    elif word.endswith('eedly'):
+        if r1 <= n - 5:
+            word = word[:-5] + 'ee'
+    else:
+        if word.endswith('ed'):
+            length = 2
+        elif word.endswith('edly'):
+            length = 4
+        elif word.endswith('ing'):
+            length = 3
+        elif word.endswith('ingly'):
+            length = 5
+        else:
+            length = 0
+        if length and classes.find('v', 0, n - length) != -1:
+            word = word[:-length]
+            ending = word[-2:]
+            if ending == 'at' or ending == 'bl' or ending == 'iz':
+                word += 'e'
+            elif ending in _doubles:
+                word = word[:-1]
+            elif %(short_word)s:
+                word += 'e'
+
+    # Step 1c.
+    n = len(word)
+    if word[-1] in 'Yy' and n > 2 and word[-2] not in 'aeiouy':
+        word = word[:-1] + 'i'
+
+    # Step 2.
+    n = len(word)
+%(step_2)s
+
+    # Step 3.
+    n = len(word)
+%(step_3)s
+
+    # Step 4.
+    n = len(word)
+%(step_4)s
+
+    # Step 5, then lowercase the Ys again.
+    n = len(word)
+    last = word[-1]
+    if last == 'e':
+        if r2 <= n - 1:
+            word = word[:-1]
+        elif r1 <= n - 1:
+            shorter = word[:-1]
+            if not %(short_shorter)s:
+                word = shorter
+    elif last == 'l':
+        if r2 <= n - 1 and word[-2] == 'l':
+            word = word[:-1]
+
+    if 'Y' in word:
+        word = word.replace('Y', 'y')
+
+    return word
+'''
+
+
+def _is_short(name):
+    """
+    Return an expression for Porter2Stemmer.is_short on a variable.
+    """
+    return ('(r1 >= len(%(w)s) and ('
+            '(len(%(w)s) > 2 and %(w)s[-3] not in "aeiouy" and '
+            '%(w)s[-2] in "aeiouy" and %(w)s[-1] not in "aeiouwxY") or '
+            '(len(%(w)s) == 2 and %(w)s[0] in "aeiouy" and '
+            '%(w)s[1] not in "aeiouy")))' % {'w': name})
+
+
+def _step_2_action(suffix, replacement):
+    length = len(suffix)
+    condition = 'r1 <= n - %d' % length
+    if suffix == 'ogi':
+        condition += " and word[n - %d] == 'l'" % (length + 1)
+    elif suffix == 'li':
+        condition += " and word[n - %d] in 'cdeghkmnrt'" % (length + 1)
+
+    return ['if %s:' % condition,
+            '    word = word[:n - %d] + %r' % (length, replacement)]
+
+
+def _step_3_action(suffix, replacement):
+    length = len(suffix)
+    condition = 'r1 <= n - %d' % length
+    if suffix == 'ative':
+        condition += ' and r2 <= n - %d' % length
+
+    return ['if %s:' % condition,
+            '    word = word[:n - %d] + %r' % (length, replacement)]
+
+
+def _step_4_action(suffix, replacement):
+    length = len(suffix)
+    condition = 'r2 <= n - %d' % length
+    if suffix == 'ion':
+        condition += " and word[n - %d] in 'st'" % (length + 1)
+
+    return ['if %s:' % condition,
+            '    word = word[:n - %d]' % length]
+
+
+def _dispatch(table, action, indent='    '):
+    """
+    Unroll a suffix table into nested ifs that test the letters
+    of the word from the end, so that only the longest matching
+    suffix is acted on.
+    """
+    def lines_for(matched, fallback):
+        depth = len(matched)
+        own = action(matched, table[matched]) if matched in table else fallback
+        longer = [suffix for suffix in table
+                  if len(suffix) > depth and suffix.endswith(matched)]
+        letters = sorted(set(suffix[-depth - 1] for suffix in longer))
+
+        if not letters:
+            return own or ['pass']
+
+        lines = []
+        for number, letter in enumerate(letters):
+            keyword = 'if' if number == 0 else 'elif'
+            lines.append('%s n > %d and word[-%d] == %r:' % (
+                keyword, depth, depth + 1, letter))
+            lines.extend('    ' + line
+                         for line in lines_for(letter + matched, own))
+        if own:
+            lines.append('else:')
+            lines.extend('    ' + line for line in own)
+
+        return lines
+
+    return '\n'.join(indent + line for line in lines_for('', None))
+
+
+def generate_source():
+    """
+    Return the source code of the specialized stemming function.
+    """
+    return _TEMPLATE % {
+        'short_word': _is_short('word'),
+        'short_shorter': _is_short('shorter'),
+        'step_2': _dispatch(_STEP_2, _step_2_action),
+        'step_3': _dispatch(_STEP_3, _step_3_action),
+        'step_4': _dispatch(_STEP_4, _step_4_action),
+    }
+
+
+def compile_stemmer(stemmer=None):
+    """
+    Compile the specialized stemming function, honouring the
+    exceptions and overrides of the stemmer if one is given,
+    including overrides added to it later.
+    """
+    if stemmer is None:
+        exceptions = Porter2Stemmer().exceptions.get
+    else:
+        def exceptions(word):
+            return stemmer.exceptions.get(word)
+
+    namespace = {'_exceptions': exceptions,
+                 '_LETTER_CLASSES': _LETTER_CLASSES,
+                 '_R1_PREFIXES': _R1_PREFIXES,
+                 '_STEP_1A_INVARIANTS': _STEP_1A_INVARIANTS,
+                 '_DOUBLES': frozenset(Porter2Stemmer.doubles),
+                 '_MAXSIZE': sys.maxsize}
+    code = compile(generate_source(), '<porter2stemmer.compiled>', 'exec')
+    exec(code, namespace)
+
+    return namespace['fast_stem']
+
+
+def __getattr__(name):
+    if name != 'fast_stem':
+        raise AttributeError('module %r has no attribute %r'
+                             % (__name__, name))
+
+    global fast_stem
+    fast_stem = compile_stemmer()
+    return fast_stem
@@ -0,0 +1,102 @@
+"""
+Check stemming backends against a vocabulary of known stems
+and measure how fast they are.
+
+A vocabulary is a CSV file, optionally gzip compressed, with
+one 'word,stem' pair per line. The tests ship one with some
+40,000 words stemmed by the Snowball project's reference
+English stemmer.
+"""
+
+import argparse
+import gzip
+import io
+import time
+
+from .porter2stemmer import Porter2Stemmer
+
+
+def load_vocabulary(path):
+    """
+    Read a vocabulary file and return a list of (word, stem) pairs.
+    """
+    if path.endswith('.gz'):
+        stream = io.TextIOWrapper(gzip.open(path), encoding='utf-8')
+    else:
+        stream = io.open(path, encoding='utf-8')
+
+    with stream:
+        return [tuple(line.rstrip('\n').split(',')) for line in stream
+                if line.strip()]
+
+
+def check_backend(stem, pairs, batch=False):
+    """
+    Stem every word in the pairs with a backend and compare the
+    results with the expected stems.
+
+    The backend is a function that stems one word, or a list of
+    words if batch is true. Returns a dict with the number of
+    words checked, the words per second, the conformance rate and
+    the (word, expected, actual) triples that didn't match.
+    """
+    words = [word for word, expected in pairs]
+
+    start = time.perf_counter()
+    if batch:
+        stems = list(stem(words))
+    else:
+        stems = [stem(word) for word in words]
+    elapsed = time.perf_counter() - start
+
+    mismatches = [(word, expected, actual)
+                  for (word, expected), actual in zip(pairs, stems)
+                  if expected != actual]
+
+    return {'words': len(words),
+            'words_per_sec': len(words) / elapsed if elapsed else 0.0,
+            'conformance': 1.0 - float(len(mismatches)) / max(1, len(words)),
+            'mismatches': mismatches}
+
+
+def format_report(name, report):
+    """
+    Summarize a check_backend report on one line. The mismatches
+    are counted, as the rounded rate can read 100.00% with a few.
+    """
+    return ('%-12s %7d words  %6.2f%% conformant  %5d mismatches  '
+            '%10.0f words/s' % (name, report['words'],
+                                100 * report['conformance'],
+                                len(report['mismatches']),
+                                report['words_per_sec']))
+
+
+def main(argv=None):
+    """
+    Check the built-in backends against the vocabulary file
+    named on the command line and print a report for each.
+    """
+    parser = argparse.ArgumentParser(
+        description='Check stemming backends against a vocabulary.')
+    parser.add_argument('vocabulary', help="file of 'word,stem' lines")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='list the words that did not match')
+    args = parser.parse_args(argv)
+
+    pairs = load_vocabulary(args.vocabulary)
+    backends = [('python', Porter2Stemmer().stem, False),
+                ('cached', Porter2Stemmer(cache_size=65536).stem, False),
+                ('batch', Porter2Stemmer().stem_many, True)]
+
+    for name, stem, batch in backends:
+        report = check_backend(stem, pairs, batch)
+        print(format_report(name, report))
+        if args.verbose:
+            for mismatch in report['mismatches']:
+                print('  %s: expected %s, got %s' % mismatch)
+
+    return 0
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Keep the stems of a document up to date as it is edited.
+"""
+
+from .porter2stemmer import Porter2Stemmer
+from .text import tokenize
+
+
+class StemmedDocument(object):
+    """
+    The tokens and stems of one document, and how many times each
+    stem occurs in it. When a new version of the document comes in,
+    only the tokens between the unchanged beginning and end are
+    considered, and only tokens not already in the document are
+    stemmed. Each update returns the stems the document gained and
+    lost, for keeping an index of documents by stem up to date.
+    """
+
+    def __init__(self, text=u'', stemmer=None, stopwords=None):
+        self.stemmer = stemmer or Porter2Stemmer()
+        self.stopwords = frozenset(stopwords or ())
+        self.tokens = []
+        self.stems = []
+        self.counts = {}
+        # Each token in the document maps to [stem, occurrences].
+        self._token_stems = {}
+        if text:
+            self.update(text)
+
+    def __contains__(self, stemmed):
+        return stemmed in self.counts
+
+    def update(self, text):
+        """
+        Replace the document with a new version of its text, and
+        return (added, removed), the sets of stems that now occur
+        in the document but didn't, and that no longer occur in it.
+        """
+        return self.update_tokens(tokenize(text))
+
+    def update_tokens(self, tokens):
+        """
+        Replace the document with a new version given as lowercase
+        tokens, and return (added, removed) as update does.
+        """
+        stopwords = self.stopwords
+        tokens = [token for token in tokens if token not in stopwords]
+        old = self.tokens
+
+        limit = min(len(old), len(tokens))
+        start = 0
+        while start < limit and old[start] == tokens[start]:
+            start += 1
+        end = 0
+        while end < limit - start and old[-end - 1] == tokens[-end - 1]:
+            end += 1
+
+        counts = self.counts
+        token_stems = self._token_stems
+        stem = self.stemmer.stem
+        added = set()
+        removed = set()
+
+        # Count the new tokens before dropping the old ones, so that
+        # a token that only moved is still known and isn't stemmed.
+        new_stems = []
+        for token in tokens[start:len(tokens) - end]:
+            entry = token_stems.get(token)
+            if entry is None:
+                entry = token_stems[token] = [stem(token), 0]
+            entry[1] += 1
+            stemmed = entry[0]
+            new_stems.append(stemmed)
+            count = counts.get(stemmed, 0)
+            if not count:
+                added.add(stemmed)
+            counts[stemmed] = count + 1
+
+        for token in old[start:len(old) - end]:
+            entry = token_stems[token]
+            entry[1] -= 1
+            if not entry[1]:
+                del token_stems[token]
+            stemmed = entry[0]
+            count = counts[stemmed] - 1
+            if count:
+                counts[stemmed] = count
+            else:
+                del counts[stemmed]
+                removed.add(stemmed)
+
+        self.stems[start:len(old) - end] = new_stems
+        self.tokens = tokens
+
+        return added, removed
@@ -0,0 +1,107 @@
+"""
+An index from stems to the words that have them, for
+expanding queries to every form of a word.
+"""
+
+import gzip
+import io
+import json
+
+from .porter2stemmer import Porter2Stemmer
+from .text import tokenize
+
+
+class StemIndex(object):
+    """
+    Map stems to the surface forms seen with them and how often
+    each form occurred. Words can be added at any time, and each
+    distinct word is only stemmed the first time it is seen.
+    """
+
+    def __init__(self, stemmer=None):
+        self.stemmer = stemmer or Porter2Stemmer()
+        self._stems = {}
+        self._forms = {}
+
+    def __len__(self):
+        return len(self._forms)
+
+    def __contains__(self, stemmed):
+        return stemmed in self._forms
+
+    def __iter__(self):
+        return iter(self._forms)
+
+    def add_words(self, words):
+        """
+        Count the words, which should already be lowercased tokens.
+        """
+        stem = self.stemmer.stem
+        stems = self._stems
+        forms = self._forms
+
+        for word in words:
+            try:
+                stemmed = stems[word]
+            except KeyError:
+                stemmed = stems[word] = stem(word)
+            counts = forms.setdefault(stemmed, {})
+            counts[word] = counts.get(word, 0) + 1
+
+    def add_text(self, text):
+        """
+        Tokenize the text and count its words.
+        """
+        self.add_words(tokenize(text))
+
+    def forms(self, stemmed):
+        """
+        Return the words seen with the stem and their frequencies
+        as (word, frequency) pairs, most frequent first.
+        """
+        counts = self._forms.get(stemmed, {})
+        return sorted(counts.items(), key=lambda pair: (-pair[1], pair[0]))
+
+    def expand(self, word):
+        """
+        Return every word seen with the same stem as the word,
+        most frequent first.
+        """
+        stemmed = self._stems.get(word)
+        if stemmed is None:
+            stemmed = self.stemmer.stem(word)
+
+        return [form for form, frequency in self.forms(stemmed)]
+
+    def frequency(self, stemmed):
+        """
+        Return how often words with the stem were seen.
+        """
+        return sum(self._forms.get(stemmed, {}).values())
+
+    def save(self, path):
+        """
+        Write the index to a JSON file, gzip compressed
+        if the path ends in .gz.
+        """
+        data = json.dumps(self._forms, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+        opener = gzip.open if path.endswith('.gz') else io.open
+        with opener(path, 'wb') as output:
+            output.write(data)
+
+    @classmethod
+    def load(cls, path, stemmer=None):
+        """
+        Read an index written by save.
+        """
+        opener = gzip.open if path.endswith('.gz') else io.open
+        with opener(path, 'rb') as source:
+            forms = json.loads(source.read().decode('utf-8'))
+
+        index = cls(stemmer)
+        index._forms = forms
+        index._stems = dict((word, stemmed)
+                            for stemmed, counts in forms.items()
+                            for word in counts)
+        return index
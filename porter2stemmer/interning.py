@@ -0,0 +1,93 @@
+"""
+Share one copy of each stem, and number the stems with small
+integers, for indexes that hold many references to them.
+"""
+
+import threading
+from array import array
+
+from .porter2stemmer import Porter2Stemmer
+
+
+class InternedStemmer(object):
+    """
+    Stem words with a stemmer, returning one canonical string
+    object for each distinct stem, or its integer ID. IDs count up
+    from 0 in the order stems are first seen, and can be turned
+    back into stems with string or strings.
+    """
+
+    def __init__(self, stemmer=None):
+        self.stemmer = stemmer or Porter2Stemmer()
+        self._ids = {}
+        self._stems = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._stems)
+
+    def __contains__(self, stemmed):
+        return stemmed in self._ids
+
+    def __iter__(self):
+        return iter(self._stems)
+
+    def _id(self, stemmed):
+        try:
+            return self._ids[stemmed]
+        except KeyError:
+            with self._lock:
+                stem_id = self._ids.get(stemmed)
+                if stem_id is None:
+                    # Readers don't take the lock, so the stem must be
+                    # in the list before its ID can be seen.
+                    stem_id = len(self._stems)
+                    self._stems.append(stemmed)
+                    self._ids[stemmed] = stem_id
+                return stem_id
+
+    def intern(self, stemmed):
+        """
+        Return the canonical copy of a stem, adding it if it is new.
+        """
+        return self._stems[self._id(stemmed)]
+
+    def stem(self, word):
+        """
+        Stem the word and return the canonical copy of its stem.
+        """
+        return self._stems[self._id(self.stemmer.stem(word))]
+
+    def stem_id(self, word):
+        """
+        Stem the word and return the ID of its stem.
+        """
+        return self._id(self.stemmer.stem(word))
+
+    def stem_ids(self, words):
+        """
+        Stem the words and return the IDs of their stems
+        as a compact array of unsigned integers.
+        """
+        stem = self.stemmer.stem
+        identify = self._id
+        return array('I', [identify(stem(word)) for word in words])
+
+    def id_of(self, stemmed):
+        """
+        Return the ID of a stem, raising KeyError if it hasn't been seen.
+        """
+        return self._ids[stemmed]
+
+    def string(self, stem_id):
+        """
+        Return the stem with the ID.
+        """
+        return self._stems[stem_id]
+
+    def strings(self, stem_ids):
+        """
+        Return the stems with the IDs as a list.
+        """
+        stems = self._stems
+        return [stems[stem_id] for stem_id in stem_ids]
@@ -0,0 +1,181 @@
+"""
+Precomputed stem tables that are looked up through mmap.
+
+A table file holds the stems of a fixed vocabulary, sorted by
+word, so that many processes can share one page-cached copy
+and look words up without loading it into memory.
+
+The format is a header of the magic bytes, a version, the
+number of entries and a fingerprint of the stemmer that wrote
+the table, then one fixed-size index entry per word
+giving the offset and lengths of its record, then the records
+themselves: the UTF-8 word immediately followed by its stem.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+
+from .porter2stemmer import Porter2Stemmer
+
+
+MAGIC = b'P2ST'
+VERSION = 2
+
+_HEADER = struct.Struct('<4sHI20s')
+_ENTRY = struct.Struct('<IHH')
+
+
+def stemmer_fingerprint(stemmer=None):
+    """
+    Return a digest of the package version and the exceptions
+    and overrides of the stemmer, which a table's stems depend on.
+    """
+    from . import __version__
+
+    stemmer = stemmer or Porter2Stemmer()
+    rules = [__version__, sorted(stemmer.exceptions.items())]
+    return hashlib.sha1(json.dumps(rules).encode('utf-8')).digest()
+
+
+def compile_stem_table(words, path, stemmer=None):
+    """
+    Stem the words and write them with their stems to a table
+    file at path. Duplicate words are stored once.
+    """
+    stemmer = stemmer or Porter2Stemmer()
+    entries = sorted(set(word.encode('utf-8') for word in words))
+
+    index = []
+    records = []
+    offset = _HEADER.size + _ENTRY.size * len(entries)
+    for word in entries:
+        stemmed = stemmer.stem(word.decode('utf-8')).encode('utf-8')
+        index.append(_ENTRY.pack(offset, len(word), len(stemmed)))
+        records.append(word + stemmed)
+        offset += len(word) + len(stemmed)
+
+    # Write to a temporary file first so readers never see a
+    # partly written table.
+    temp_path = '%s.%d.tmp' % (path, os.getpid())
+    with io.open(temp_path, 'wb') as table:
+        table.write(_HEADER.pack(MAGIC, VERSION, len(entries),
+                                 stemmer_fingerprint(stemmer)))
+        table.write(b''.join(index))
+        table.write(b''.join(records))
+    os.replace(temp_path, path)
+
+    return len(entries)
+
+
+class MappedStemmer(object):
+    """
+    Look stems up in a table file written by compile_stem_table,
+    falling back to a stemmer for words that aren't in it.
+    """
+
+    def __init__(self, path, fallback=None):
+        self.path = path
+        self.fallback = fallback or Porter2Stemmer()
+
+        with io.open(path, 'rb') as table:
+            self._map = mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version = None, None
+        if len(self._map) >= _HEADER.size:
+            magic, version, self._count, self.fingerprint = (
+                _HEADER.unpack_from(self._map, 0))
+
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError('%s is not a version %d stem table'
+                             % (path, VERSION))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, word):
+        return self.lookup(word) is not None
+
+    def close(self):
+        """
+        Unmap the table file.
+        """
+        self._map.close()
+
+    def lookup(self, word):
+        """
+        Return the stem of the word from the table,
+        or None if the word isn't in it.
+        """
+        key = word.encode('utf-8')
+        table = self._map
+        unpack_entry = _ENTRY.unpack_from
+        low = 0
+        high = self._count
+
+        while low < high:
+            middle = (low + high) // 2
+            offset, word_length, stem_length = unpack_entry(
+                table, _HEADER.size + middle * _ENTRY.size)
+            entry = table[offset:offset + word_length]
+
+            if entry < key:
+                low = middle + 1
+            elif entry > key:
+                high = middle
+            else:
+                start = offset + word_length
+                return table[start:start + stem_length].decode('utf-8')
+
+        return None
+
+    def stem(self, word):
+        """
+        Stem the word from the table, or with the
+        fallback stemmer if it isn't in the table.
+        """
+        stemmed = self.lookup(word)
+        if stemmed is None:
+            return self.fallback.stem(word)
+
+        return stemmed
+
+    def stem_many(self, words):
+        """
+        Stem a batch of words and return the stems as a list.
+        """
+        stem = self.stem
+        return [stem(word) for word in words]
+
+
+def main(argv=None):
+    """
+    Compile a stem table from a file of words, one per line.
+    """
+    parser = argparse.ArgumentParser(
+        description='Compile a word list into a memory-mapped stem table.')
+    parser.add_argument('words', help='file with one word per line')
+    parser.add_argument('table', help='stem table file to write')
+    args = parser.parse_args(argv)
+
+    with io.open(args.words, encoding='utf-8') as words:
+        count = compile_stem_table((line.strip() for line in words
+                                    if line.strip()), args.table)
+
+    print('Wrote %d stems to %s' % (count, args.table))
+    return 0
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Stem large streams of words, or many documents, on a pool
+of worker processes.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .porter2stemmer import Porter2Stemmer
+
+
+# The stemmer used inside each worker process.
+_worker_stemmer = None
+
+
+def _init_worker(cache_size, overrides):
+    global _worker_stemmer
+    _worker_stemmer = Porter2Stemmer(cache_size=cache_size,
+                                     overrides=overrides)
+
+
+def _stem_words(words):
+    return _worker_stemmer.stem_many(words)
+
+
+def _stem_documents(documents):
+    stem_many = _worker_stemmer.stem_many
+    return [stem_many(document) for document in documents]
+
+
+def _chunks(iterable, size):
+    """
+    Split an iterable into lists of at most size items.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ParallelStemmer(object):
+    """
+    Stem words on a pool of worker processes, keeping the input
+    order. Each worker has its own cached Porter2Stemmer, with
+    the given overrides, and receives whole chunks, so only one
+    message goes each way per chunk.
+    """
+
+    def __init__(self, workers=None, chunk_size=10000, cache_size=65536,
+                 overrides=None):
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        self.overrides = dict(overrides or {})
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Shut down the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(self.cache_size, self.overrides))
+
+        return self._executor
+
+    def _map(self, function, chunks):
+        """
+        Apply the function to every chunk in the pool and yield
+        the results in order, keeping only a few chunks per
+        worker in flight so that long streams use bounded memory.
+        """
+        pool = self._pool()
+        pending = deque()
+
+        for chunk in chunks:
+            if len(pending) >= 2 * self.workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(function, chunk))
+
+        while pending:
+            yield pending.popleft().result()
+
+    def iter_stem(self, words):
+        """
+        Lazily stem an iterable of words, yielding the stems
+        in order.
+        """
+        for stems in self._map(_stem_words, _chunks(words, self.chunk_size)):
+            for stemmed in stems:
+                yield stemmed
+
+    def stem_many(self, words):
+        """
+        Stem an iterable of words and return a list of the stems.
+        """
+        return list(self.iter_stem(words))
+
+    def iter_stem_documents(self, documents):
+        """
+        Lazily stem an iterable of documents, each a list of
+        words, yielding a list of stems for every document.
+        Chunks hold up to chunk_size documents.
+        """
+        for chunk in self._map(_stem_documents,
+                               _chunks(documents, self.chunk_size)):
+            for stems in chunk:
+                yield stems
+
+    def stem_documents(self, documents):
+        """
+        Stem an iterable of documents and return a list with
+        the stems of each one.
+        """
+        return list(self.iter_stem_documents(documents))
@@ -0,0 +1,175 @@
+"""
+A stem cache kept in an SQLite file, so that stems worked out
+by one run are available to the next.
+"""
+
+import sqlite3
+import threading
+
+
+class PersistentCache(object):
+    """
+    A cache with the interface of LRUCache that keeps its entries
+    in an SQLite database. Every entry is loaded into memory when
+    the cache is opened, and only words not already in the file
+    are written back, in batches of flush_size.
+
+    The database uses write-ahead logging, so any number of
+    processes can read it while one of them writes. Each opening
+    of the file starts a new generation, and entries record the
+    last generation that used them. When the file holds more than
+    maxsize entries, those least recently used are deleted.
+
+    Stemmers look up their exceptions and overrides before the
+    cache and never cache them, so stemmers with different
+    overrides can share the same file.
+    """
+
+    flush_size = 1024
+
+    def __init__(self, path, maxsize=1000000, timeout=30.0):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        self.path = path
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._new = {}
+        self._used = set()
+
+        self._db = sqlite3.connect(path, timeout=timeout,
+                                   check_same_thread=False)
+        with self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS stems ('
+                             'word TEXT PRIMARY KEY, stem TEXT NOT NULL, '
+                             'used INTEGER NOT NULL)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS stems_used '
+                             'ON stems (used)')
+            self._db.execute('CREATE TABLE IF NOT EXISTS meta ('
+                             'key TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+            self._db.execute("INSERT OR IGNORE INTO meta VALUES "
+                             "('generation', 0)")
+            self._db.execute("UPDATE meta SET value = value + 1 "
+                             "WHERE key = 'generation'")
+            self.generation = self._db.execute(
+                "SELECT value FROM meta WHERE key = 'generation'").fetchone()[0]
+
+        self._data = dict(self._db.execute(
+            'SELECT word, stem FROM stems ORDER BY used DESC LIMIT ?',
+            (maxsize,)))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for the key,
+        or the default if it is absent.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            if key not in self._new:
+                self._used.add(key)
+            return value
+
+    def put(self, key, value):
+        """
+        Cache the value for the key, writing new entries to the
+        file once flush_size of them have built up.
+        """
+        with self._lock:
+            if key in self._data:
+                return
+
+            if len(self._data) < self.maxsize:
+                self._data[key] = value
+            self._new[key] = value
+            if len(self._new) >= self.flush_size:
+                self._flush()
+
+    def flush(self):
+        """
+        Write new entries to the file, and compact it if it has
+        grown past maxsize.
+        """
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._new and not self._used:
+            return
+
+        generation = self.generation
+        with self._db:
+            self._db.executemany(
+                'INSERT OR IGNORE INTO stems VALUES (?, ?, ?)',
+                ((word, stemmed, generation)
+                 for word, stemmed in self._new.items()))
+            self._db.executemany(
+                'UPDATE stems SET used = ? WHERE word = ? AND used < ?',
+                ((generation, word, generation) for word in self._used))
+
+            size = self._db.execute('SELECT COUNT(*) FROM stems').fetchone()[0]
+            if size > self.maxsize:
+                self._db.execute(
+                    'DELETE FROM stems WHERE word IN (SELECT word FROM stems '
+                    'ORDER BY used LIMIT ?)', (size - self.maxsize,))
+                self.evictions += size - self.maxsize
+
+        self._new.clear()
+        self._used.clear()
+
+    def clear(self):
+        """
+        Delete every entry, from the file as well as memory,
+        and reset the statistics.
+        """
+        with self._lock:
+            with self._db:
+                self._db.execute('DELETE FROM stems')
+            self._data.clear()
+            self._new.clear()
+            self._used.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def close(self):
+        """
+        Write new entries to the file and close it.
+        """
+        with self._lock:
+            if self._db is not None:
+                self._flush()
+                self._db.close()
+                self._db = None
+
+    def info(self):
+        """
+        Return a snapshot of the cache statistics as a dict.
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'size': len(self._data),
+                    'maxsize': self.maxsize}
@@ -16,8 +16,114 @@
 # print stemmer.stem('conspicuous')                   #
 #######################################################
 
+import io
 import sys
-import re
+from types import MappingProxyType
+
+
+# Words the spec stems irregularly or leaves alone. They are
+# looked up before any other processing.
+EXCEPTIONS = MappingProxyType({
+    'skis': 'ski', 'skies': 'sky', 'dying': 'die', 'lying': 'lie',
+    'tying': 'tie', 'idly': 'idl', 'gently': 'gentl', 'ugly': 'ugli',
+    'early': 'earli', 'only': 'onli', 'singly': 'singl', 'sky': 'sky',
+    'news': 'news', 'howe': 'howe', 'atlas': 'atlas', 'cosmos': 'cosmos',
+    'bias': 'bias', 'andes': 'andes'})
+
+# Words left as they are once step 1a has been applied.
+_STEP_1A_INVARIANTS = frozenset(['inning', 'outing', 'canning', 'herring',
+                                 'earring', 'proceed', 'exceed', 'succeed'])
+
+# Prefixes that R1 starts after, instead of the usual rule.
+_R1_PREFIXES = ('gener', 'commun', 'arsen')
+
+
+# Suffix replacements for steps 2, 3 and 4 of the algorithm,
+# which the spec numbers differently from the methods below.
+_STEP_2 = {'tional': 'tion', 'enci': 'ence', 'anci': 'ance',
+           'abli': 'able', 'entli': 'ent', 'izer': 'ize',
+           'ization': 'ize', 'ational': 'ate', 'ation': 'ate',
+           'ator': 'ate', 'alism': 'al', 'aliti': 'al', 'alli': 'al',
+           'fulness': 'ful', 'ousli': 'ous', 'ousness': 'ous',
+           'iveness': 'ive', 'iviti': 'ive', 'biliti': 'ble',
+           'bli': 'ble', 'ogi': 'og', 'fulli': 'ful', 'lessli': 'less',
+           'li': ''}
+
+_STEP_3 = {'tional': 'tion', 'ational': 'ate', 'alize': 'al',
+           'icate': 'ic', 'iciti': 'ic', 'ical': 'ic', 'ful': '',
+           'ness': '', 'ative': ''}
+
+_STEP_4 = dict.fromkeys(['al', 'ance', 'ence', 'er', 'ic', 'able', 'ible',
+                         'ant', 'ement', 'ment', 'ent', 'ism', 'ate',
+                         'iti', 'ous', 'ive', 'ize', 'ion'], '')
+
+
+def read_overrides(path):
+    """
+    Read overrides from a file with one word per line, either
+    alone to protect it from stemming or followed by a comma
+    and its stem, and return them as a dict. Blank lines and
+    lines starting with # are ignored.
+    """
+    overrides = {}
+    with io.open(path, encoding='utf-8') as lines:
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            word, _, stemmed = line.partition(',')
+            overrides[word.strip()] = stemmed.strip() or word.strip()
+
+    return overrides
+
+
+def _suffix_lookup(table):
+    """
+    Index the suffixes of a table by their last letter, and then
+    by length, longest first, so that the longest one a word ends
+    with can be found with a single set lookup per length.
+    """
+    lookup = {}
+    for last in set(suffix[-1] for suffix in table):
+        group = [suffix for suffix in table if suffix[-1] == last]
+        lengths = sorted(set(len(suffix) for suffix in group), reverse=True)
+        lookup[last] = tuple(
+            (length, frozenset(s for s in group if len(s) == length))
+            for length in lengths)
+
+    return lookup
+
+
+def _longest_suffix(word, lookup):
+    """
+    Return the longest suffix in the lookup that
+    the word ends with, or None if there isn't one.
+    """
+    for length, suffixes in lookup.get(word[-1], ()):
+        ending = word[-length:]
+        if ending in suffixes:
+            return ending
+
+    return None
+
+
+_STEP_2_LOOKUP = _suffix_lookup(_STEP_2)
+_STEP_3_LOOKUP = _suffix_lookup(_STEP_3)
+_STEP_4_LOOKUP = _suffix_lookup(_STEP_4)
+
+
+class _LetterClasses(dict):
+    """
+    A str.translate table mapping vowels to 'v' and
+    every other character, ASCII or not, to 'c'.
+    """
+
+    def __missing__(self, key):
+        return 'c'
+
+
+_LETTER_CLASSES = _LetterClasses(
+    (code, 'v' if chr(code) in 'aeiouy' else 'c') for code in range(128))
 
 
 class Porter2Stemmer(object):
@@ -31,31 +137,140 @@ class Porter2Stemmer(object):
     doubles = ['bb', 'dd', 'ff', 'gg', 'mm', 'nn', 'pp', 'rr', 'tt']
     li_endings = ['c', 'd', 'e', 'g', 'h', 'k', 'm', 'n', 'r', 't']
 
-    def __init__(self):
-        self.r1 = sys.maxsize
-        self.r2 = sys.maxsize
+    # Number of distinct words iter_stem remembers before starting over.
+    batch_memo_size = 65536
+
+    def __init__(self, cache_size=None, overrides=None, cache=None):
+        """
+        Pass a cache_size to memoize up to that many of the
+        most recently stemmed words, or a cache with the interface
+        of LRUCache, such as a PersistentCache, to use it instead.
+        Pass overrides to map words to stems of your choosing,
+        or to themselves to protect them from stemming.
+        """
+        self.cache = None
+        self.exceptions = EXCEPTIONS
+        if overrides:
+            self.add_overrides(overrides)
+
+        if cache is not None:
+            self.cache = cache
+        elif cache_size:
+            # Imported here so that uncached use doesn't load threading.
+            from .cache import LRUCache
+            self.cache = LRUCache(cache_size)
+
+    def add_overrides(self, overrides):
+        """
+        Map the words in the overrides mapping to the stems
+        given for them, ahead of the algorithm and the spec's
+        exceptional forms. The cache is left alone, as stem looks
+        words up in the exceptions before the cache.
+        """
+        exceptions = dict(self.exceptions)
+        exceptions.update(overrides)
+        self.exceptions = MappingProxyType(exceptions)
+
+    def load_overrides(self, path):
+        """
+        Add overrides from a file, as read by read_overrides.
+        """
+        self.add_overrides(read_overrides(path))
 
     def stem(self, word):
         """
-        Stem the word if it has more than two characters,
-        otherwise return it as is.
+        Stem the word, using the cache if one is enabled.
+        """
+        if self.cache is None:
+            return self.stem_word(word)
+
+        stemmed = self.exceptions.get(word)
+        if stemmed is not None:
+            return stemmed
+
+        stemmed = self.cache.get(word)
+        if stemmed is None:
+            stemmed = self.stem_word(word)
+            self.cache.put(word, stemmed)
+
+        return stemmed
+
+    def stem_many(self, words):
+        """
+        Stem a batch of words and return the stems as a list
+        in the same order. Each distinct word is stemmed once.
+        """
+        if not isinstance(words, (list, tuple)):
+            words = list(words)
+
+        stem = self.stem
+        stems = dict((word, stem(word)) for word in set(words))
+
+        return [stems[word] for word in words]
+
+    def iter_stem(self, words):
+        """
+        Lazily stem an iterable of words, yielding the stems
+        in order. Repeated words are only stemmed once, up to
+        batch_memo_size distinct words at a time.
+        """
+        stem = self.stem
+        stems = {}
+        memo_size = self.batch_memo_size
+
+        for word in words:
+            try:
+                yield stems[word]
+            except KeyError:
+                if len(stems) >= memo_size:
+                    stems.clear()
+                stemmed = stems[word] = stem(word)
+                yield stemmed
+
+    def cache_info(self):
+        """
+        Return the hit, miss and eviction counts and the size
+        of the cache as a dict, or None if caching is disabled.
         """
+        if self.cache is None:
+            return None
+
+        return self.cache.info()
+
+    def cache_clear(self):
+        """
+        Empty the cache and reset its statistics.
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
+    def stem_word(self, word):
+        """
+        Stem the word if it has more than two characters and
+        isn't an exception, otherwise return it as is.
+        """
+        stemmed = self.exceptions.get(word)
+        if stemmed is not None:
+            return stemmed
 
         if len(word) <= 2:
             return word
         else:
             word = self.remove_initial_apostrophe(word)
             word = self.set_ys(word)
-            self.find_regions(word)
+            r1, r2 = self.find_regions(word)
 
             word = self.strip_possessives(word)
             word = self.replace_suffixes_1(word)
-            word = self.replace_suffixes_2(word)
+            if word in _STEP_1A_INVARIANTS:
+                return word
+
+            word = self.replace_suffixes_2(word, r1)
             word = self.replace_ys(word)
-            word = self.replace_suffixes_3(word)
-            word = self.replace_suffixes_4(word)
-            word = self.delete_suffixes(word)
-            word = self.process_terminals(word)
+            word = self.replace_suffixes_3(word, r1)
+            word = self.replace_suffixes_4(word, r1, r2)
+            word = self.delete_suffixes(word, r2)
+            word = self.process_terminals(word, r1, r2)
 
             return word
 
@@ -74,52 +289,70 @@ class Porter2Stemmer(object):
         as consonants and make them uppercase.
         """
 
+        if 'y' not in word:
+            return word
+
+        chars = None
         if word[0] == 'y':
-            word = 'Y' + word[1:]
+            chars = list(word)
+            chars[0] = 'Y'
 
-        for match in re.finditer("[aeiou]y", word):
-            y_index = match.end() - 1
-            char_list = [x for x in word]
-            char_list[y_index] = 'Y'
-            word = ''.join(char_list)
+        index = word.find('y', 1)
+        while index != -1:
+            if word[index - 1] in 'aeiou':
+                if chars is None:
+                    chars = list(word)
+                chars[index] = 'Y'
+            index = word.find('y', index + 1)
 
-        return word
+        return word if chars is None else ''.join(chars)
 
     def find_regions(self, word):
         """
-        Find regions R1 and R2.
+        Find regions R1 and R2 and return their start indexes.
+        A region that is empty starts at sys.maxsize.
         """
+        # Each region starts after the next vowel followed by a
+        # non-vowel, which str.find can spot in the letter classes.
+        classes = word.translate(_LETTER_CLASSES)
         length = len(word)
+        r1 = sys.maxsize
+        r2 = sys.maxsize
+
+        if word.startswith(_R1_PREFIXES):
+            end = next(len(prefix) for prefix in _R1_PREFIXES
+                       if word.startswith(prefix))
+        else:
+            index = classes.find('vc')
+            end = index + 2 if index != -1 else length
+
+        if end < length:
+            r1 = end
+            index = classes.find('vc', r1)
+            if index != -1 and index + 2 < length:
+                r2 = index + 2
 
-        for index, match in enumerate(re.finditer("[aeiouy][^aeiouy]", word)):
-            if index == 0:
-                if match.end() < length:
-                    self.r1 = match.end()
-            if index == 1:
-                if match.end() < length:
-                    self.r2 = match.end()
-                break
+        return r1, r2
 
-    def is_short(self, word):
+    def is_short(self, word, r1):
         """
         Determine if the word is short. Short words
         are ones that end in a short syllable and
         have an empty R1 region.
         """
 
-        short = False
         length = len(word)
 
-        if self.r1 >= length:
-            if length > 2:
-                ending = word[length - 3:]
-                if re.match("[^aeiouy][aeiouy][^aeiouwxY]", ending):
-                    short = True
-            else:
-                if re.match("[aeiouy][^aeiouy]", word):
-                    short = True
-
-        return short
+        if r1 < length:
+            return False
+        elif length > 2:
+            if word[-3] in 'aeiouy' or word[-2] not in 'aeiouy':
+                return False
+            return word[-1] not in 'aeiouwxY'
+        elif length == 2:
+            return word[0] in 'aeiouy' and word[1] not in 'aeiouy'
+        else:
+            return False
 
     def strip_possessives(self, word):
         """
@@ -147,7 +380,7 @@ class Porter2Stemmer(object):
 
         elif word.endswith("ied") or word.endswith("ies"):
             word = word[:-3]
-            if len(word) == 1:
+            if len(word) <= 1:
                 word += 'ie'
             else:
                 word += 'i'
@@ -167,7 +400,7 @@ class Porter2Stemmer(object):
 
         return word
 
-    def replace_suffixes_2(self, word):
+    def replace_suffixes_2(self, word, r1):
         """
         Find the longest suffix among the ones specified
         and perform the required action.
@@ -175,12 +408,12 @@ class Porter2Stemmer(object):
         has_vowel = False
 
         if word.endswith('eed'):
-            if len(word) >= self.r1:
+            if r1 <= len(word) - 3:
                 word = word[:-3] + 'ee'
             return word
 
         elif word.endswith('eedly'):
-            if len(word) >= self.r1:
+            if r1 <= len(word) - 5:
                 word = word[:-5] + 'ee'
             return word
 
@@ -219,7 +452,7 @@ class Porter2Stemmer(object):
                 word += 'e'
             elif word[length - 2:] in self.doubles:
                 word = word[:-1]
-            elif self.is_short(word):
+            elif self.is_short(word, r1):
                 word += 'e'
 
         return word
@@ -238,81 +471,65 @@ class Porter2Stemmer(object):
 
         return word
 
-    def replace_suffixes_3(self, word):
-        """.
+    def replace_suffixes_3(self, word, r1):
+        """
         Perform replacements on more common suffixes.
+        Only the longest matching suffix is considered.
         """
-        length = len(word)
+        suffix = _longest_suffix(word, _STEP_2_LOOKUP)
+        if suffix is None:
+            return word
 
-        replacements = {'tional': 'tion', 'enci': 'ence', 'anci': 'ance',
-                        'abli': 'able', 'entli': 'ent', 'ization': 'ize',
-                        'izer': 'ize', 'ation': 'ate', 'ator': 'ate', 'alism': 'al',
-                        'aliti': 'al', 'alli': 'al', 'fulness': 'ful',
-                        'ousness': 'ous', 'ousli': 'ous', 'iveness': 'ive',
-                        'iviti': 'ive', 'biliti': 'ble', 'bli': 'ble',
-                        'fulli': 'ful', 'lessli': 'less'}
-
-        for suffix in replacements.keys():
-            if word.endswith(suffix):
-                suffix_length = len(suffix)
-                if self.r1 <= (length - suffix_length):
-                    word = word[:-suffix_length] + replacements[suffix]
-
-        if word.endswith('ogi'):
-            if self.r1 <= (length - 3):
-                if (length - 3) > 0:
-                    if word[length - 4] == 'l':
-                        word = word[:-3]
-
-        if word.endswith('li'):
-            if self.r1 <= (length - 2):
-                if word[length - 3] in self.li_endings:
-                    word = word[:-2]
+        start = len(word) - len(suffix)
+        if r1 > start:
+            return word
 
-        return word
+        if suffix == 'ogi':
+            if word[start - 1] != 'l':
+                return word
+        elif suffix == 'li':
+            if word[start - 1] not in self.li_endings:
+                return word
 
-    def replace_suffixes_4(self, word):
+        return word[:start] + _STEP_2[suffix]
+
+    def replace_suffixes_4(self, word, r1, r2):
         """
         Perform replacements on even more common suffixes.
+        Only the longest matching suffix is considered.
         """
-        length = len(word)
-        replacements = {'ational': 'ate', 'tional': 'tion', 'alize': 'al',
-                        'icate': 'ic', 'iciti': 'ic', 'ical': 'ic',
-                        'ful': '', 'ness': ''}
+        suffix = _longest_suffix(word, _STEP_3_LOOKUP)
+        if suffix is None:
+            return word
 
-        for suffix in replacements.keys():
-            if word.endswith(suffix):
-                suffix_length = len(suffix)
-                if self.r1 <= (length - suffix_length):
-                    word = word[:-suffix_length] + replacements[suffix]
+        start = len(word) - len(suffix)
+        if r1 > start:
+            return word
 
-        if word.endswith('ative'):
-            if self.r1 <= (length - 5) and self.r2 <= (length - 5):
-                word = word[:-5]
+        if suffix == 'ative' and r2 > start:
+            return word
 
-        return word
+        return word[:start] + _STEP_3[suffix]
 
-    def delete_suffixes(self, word):
+    def delete_suffixes(self, word, r2):
         """
         Delete some very common suffixes.
+        Only the longest matching suffix is considered.
         """
-        length = len(word)
-        suffixes = ['al', 'ance', 'ence', 'er', 'ic', 'able', 'ible',
-                    'ant', 'ement', 'ment', 'ent', 'ism', 'ate',
-                    'iti', 'ous', 'ive', 'ize']
+        suffix = _longest_suffix(word, _STEP_4_LOOKUP)
+        if suffix is None:
+            return word
 
-        for suffix in suffixes:
-            if word.endswith(suffix) and self.r2 <= (length - len(suffix)):
-                word = word[:-len(suffix)]
-                return word
+        start = len(word) - len(suffix)
+        if r2 > start:
+            return word
 
-        if word.endswith('ion') and self.r2 <= (length - 3):
-            if word[length - 4] in 'st':
-                word = word[:-3]
+        if suffix == 'ion' and word[start - 1] not in 'st':
+            return word
 
-        return word
+        return word[:start]
 
-    def process_terminals(self, word):
+    def process_terminals(self, word, r1, r2):
         """
         Deal with terminal Es and Ls and
         convert any uppercase Ys back to lowercase.
@@ -320,18 +537,30 @@ class Porter2Stemmer(object):
         length = len(word)
 
         if word[length - 1] == 'e':
-            if self.r2 <= (length - 1):
+            if r2 <= (length - 1):
                 word = word[:-1]
 
-            elif self.r1 <= (length - 1):
-                if not self.is_short(word[:-1]):
+            elif r1 <= (length - 1):
+                if not self.is_short(word[:-1], r1):
                     word = word[:-1]
 
         elif word[length - 1] == 'l':
-            if self.r2 <= (length - 1) and word[length - 2] == 'l':
+            if r2 <= (length - 1) and word[length - 2] == 'l':
                 word = word[:-1]
 
-        char_list = [x if x != 'Y' else 'y' for x in word]
-        word = ''.join(char_list)
+        if 'Y' in word:
+            word = word.replace('Y', 'y')
 
         return word
+
+
+# Stemmers keep no per-word state, so one instance can be
+# shared by every thread in the process.
+_default_stemmer = Porter2Stemmer()
+
+
+def stem(word):
+    """
+    Stem the word with the shared module-level stemmer.
+    """
+    return _default_stemmer.stem(word)
@@ -0,0 +1,122 @@
+"""
+A stemmer that records how long each step of the algorithm
+takes and which rules rewrite words.
+
+It is a separate subclass so that Porter2Stemmer itself pays
+nothing for the bookkeeping.
+"""
+
+import json
+import threading
+import time
+
+from .porter2stemmer import (Porter2Stemmer, _STEP_2_LOOKUP, _STEP_3_LOOKUP,
+                             _STEP_4_LOOKUP, _longest_suffix)
+
+
+# The methods Porter2Stemmer.stem_word calls for each step.
+_STEPS = ('remove_initial_apostrophe', 'set_ys', 'find_regions',
+          'strip_possessives', 'replace_suffixes_1', 'replace_suffixes_2',
+          'replace_ys', 'replace_suffixes_3', 'replace_suffixes_4',
+          'delete_suffixes', 'process_terminals')
+
+# The steps whose rules come from the suffix tables.
+_TABLES = {'replace_suffixes_3': _STEP_2_LOOKUP,
+           'replace_suffixes_4': _STEP_3_LOOKUP,
+           'delete_suffixes': _STEP_4_LOOKUP}
+
+
+def _rule(step, before, after):
+    """
+    Name the rule that rewrote the word as 'old ending -> new ending'.
+    """
+    lookup = _TABLES.get(step)
+    if lookup is not None:
+        suffix = _longest_suffix(before, lookup)
+        return '%s -> %s' % (suffix, after[len(before) - len(suffix):])
+
+    common = 0
+    for old, new in zip(before, after):
+        if old != new:
+            break
+        common += 1
+
+    return '%s -> %s' % (before[common:], after[common:])
+
+
+class ProfilingPorter2Stemmer(Porter2Stemmer):
+    """
+    A Porter2Stemmer that records the cumulative time and number
+    of calls of each step, and counts how often each rule
+    actually changes a word. The steps are timed by wrapping the
+    stemmer's own step methods, so words go through exactly the
+    pipeline of Porter2Stemmer.stem_word.
+    """
+
+    def __init__(self, cache_size=None, overrides=None, cache=None):
+        super(ProfilingPorter2Stemmer, self).__init__(cache_size, overrides,
+                                                      cache)
+        self._lock = threading.Lock()
+        self.reset()
+        for name in _STEPS:
+            setattr(self, name, self._timed(name, getattr(self, name)))
+
+    def reset(self):
+        """
+        Discard everything recorded so far.
+        """
+        with self._lock:
+            self._words = 0
+            self._calls = {}
+            self._seconds = {}
+            self._rules = {}
+
+    def _timed(self, name, step):
+        """
+        Wrap a step method so that each call is recorded.
+        """
+        def timed(word, *regions):
+            start = time.perf_counter()
+            result = step(word, *regions)
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._calls[name] = self._calls.get(name, 0) + 1
+                self._seconds[name] = self._seconds.get(name, 0.0) + elapsed
+                if result != word and name != 'find_regions':
+                    rules = self._rules.setdefault(name, {})
+                    rule = _rule(name, word, result)
+                    rules[rule] = rules.get(rule, 0) + 1
+
+            return result
+
+        return timed
+
+    def stem_word(self, word):
+        """
+        Stem the word as Porter2Stemmer does,
+        recording each step as it goes.
+        """
+        with self._lock:
+            self._words += 1
+
+        return super(ProfilingPorter2Stemmer, self).stem_word(word)
+
+    def snapshot(self):
+        """
+        Return the calls and seconds spent in each step, and the
+        number of times each rule fired, as a dict.
+        """
+        with self._lock:
+            return {'words': self._words,
+                    'steps': dict((name, {'calls': calls,
+                                          'seconds': self._seconds[name]})
+                                  for name, calls in self._calls.items()),
+                    'rules': dict((name, dict(rules))
+                                  for name, rules in self._rules.items())}
+
+    def to_json(self, **kwargs):
+        """
+        Return the snapshot as a JSON string.
+        """
+        return json.dumps(self.snapshot(), **kwargs)
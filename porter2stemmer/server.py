@@ -0,0 +1,352 @@
+"""
+A stemming server, and a client for it, that exchange batches
+of words over TCP or Unix domain sockets.
+
+Every message is a frame: a 4-byte big-endian payload length,
+then the payload. A request payload holds the words of one
+batch and the response payload holds their stems in the same
+order, each one encoded in UTF-8 and preceded by its 2-byte
+big-endian length. Clients may send several requests before
+reading the responses, which come back in order.
+"""
+
+import argparse
+import os
+import socket
+import socketserver
+import struct
+import threading
+
+from .porter2stemmer import Porter2Stemmer, read_overrides
+
+
+_FRAME_LENGTH = struct.Struct('>I')
+_ITEM_LENGTH = struct.Struct('>H')
+
+# Refuse frames larger than this rather than buffer them.
+MAX_FRAME_SIZE = 64 << 20
+
+# The longest word, in UTF-8 bytes, that an item length can hold.
+MAX_WORD_SIZE = (1 << 16) - 1
+
+
+def encode_batch(words):
+    """
+    Encode a list of words as a frame. Raises ValueError if a
+    word is longer than MAX_WORD_SIZE bytes in UTF-8.
+    """
+    pack = _ITEM_LENGTH.pack
+    items = []
+    for word in words:
+        data = word.encode('utf-8')
+        if len(data) > MAX_WORD_SIZE:
+            raise ValueError('word of %d bytes is longer than the %d byte '
+                             'limit' % (len(data), MAX_WORD_SIZE))
+        items.append(pack(len(data)))
+        items.append(data)
+
+    payload = b''.join(items)
+    return _FRAME_LENGTH.pack(len(payload)) + payload
+
+
+def decode_batch(payload):
+    """
+    Decode the payload of a frame into a list of words. Raises
+    ValueError if the payload is malformed, including words that
+    aren't valid UTF-8.
+    """
+    unpack = _ITEM_LENGTH.unpack_from
+    words = []
+    position = 0
+    end = len(payload)
+
+    while position < end:
+        if position + _ITEM_LENGTH.size > end:
+            raise ValueError('truncated item length at byte %d' % position)
+        length, = unpack(payload, position)
+        position += _ITEM_LENGTH.size
+        if position + length > end:
+            raise ValueError('item of %d bytes runs past the payload'
+                             % length)
+        words.append(payload[position:position + length].decode('utf-8'))
+        position += length
+
+    return words
+
+
+def _read_exactly(stream, size):
+    data = stream.read(size)
+    if len(data) < size:
+        if data:
+            raise ConnectionError('connection closed mid-frame')
+        return None
+    return data
+
+
+def read_frame(stream):
+    """
+    Read one frame from a binary file-like stream and return
+    its payload, or None if the stream ended between frames.
+    """
+    header = _read_exactly(stream, _FRAME_LENGTH.size)
+    if header is None:
+        return None
+
+    length, = _FRAME_LENGTH.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ValueError('frame of %d bytes is too large' % length)
+
+    if length == 0:
+        return b''
+
+    payload = _read_exactly(stream, length)
+    if payload is None:
+        raise ConnectionError('connection closed mid-frame')
+    return payload
+
+
+class _StemHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        stem_many = self.server.stem_many
+        while True:
+            # A malformed frame ends the connection; the client
+            # can't be answered in step after it.
+            try:
+                payload = read_frame(self.rfile)
+                if payload is None:
+                    return
+                words = decode_batch(payload)
+            except (ValueError, ConnectionError):
+                return
+
+            # Nor can a batch whose stems are too long to encode.
+            try:
+                response = encode_batch(stem_many(words))
+            except ValueError:
+                return
+
+            self.wfile.write(response)
+            self.wfile.flush()
+
+
+class _Stemming(object):
+    """
+    The part of the servers that stems batches, shared by
+    all connections.
+    """
+
+    def _setup_stemming(self, cache_size, workers, overrides):
+        self.stemmer = Porter2Stemmer(cache_size=cache_size,
+                                      overrides=overrides)
+        self.parallel = None
+        if workers > 1:
+            from .parallel import ParallelStemmer
+            self.parallel = ParallelStemmer(workers=workers, chunk_size=1024,
+                                            cache_size=None,
+                                            overrides=overrides)
+            self._parallel_lock = threading.Lock()
+
+    def stem_many(self, words):
+        """
+        Stem a batch, from the shared cache where possible.
+        Large batches of uncached words go to the worker
+        processes if there are any.
+        """
+        if self.parallel is None or len(words) < 4096:
+            return self.stemmer.stem_many(words)
+
+        cache = self.stemmer.cache
+        if cache is None:
+            with self._parallel_lock:
+                return self.parallel.stem_many(words)
+
+        stems = dict((word, cache.get(word)) for word in set(words))
+        missing = [word for word, stemmed in stems.items() if stemmed is None]
+
+        if missing:
+            with self._parallel_lock:
+                stemmed = self.parallel.stem_many(missing)
+            for word, stemmed_word in zip(missing, stemmed):
+                stems[word] = stemmed_word
+                cache.put(word, stemmed_word)
+
+        return [stems[word] for word in words]
+
+    def server_close(self):
+        super(_Stemming, self).server_close()
+        if self.parallel is not None:
+            self.parallel.close()
+
+
+class StemServer(_Stemming, socketserver.ThreadingTCPServer):
+    """
+    Serve stems over TCP, with one thread per connection and
+    an LRU cache shared between them.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, cache_size=65536, workers=1, overrides=None):
+        self._setup_stemming(cache_size, workers, overrides)
+        socketserver.ThreadingTCPServer.__init__(self, address, _StemHandler)
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    class UnixStemServer(_Stemming, socketserver.ThreadingUnixStreamServer):
+        """
+        Serve stems over a Unix domain socket, with one thread
+        per connection and an LRU cache shared between them.
+        """
+
+        daemon_threads = True
+
+        def __init__(self, path, cache_size=65536, workers=1,
+                     overrides=None):
+            self._setup_stemming(cache_size, workers, overrides)
+            socketserver.ThreadingUnixStreamServer.__init__(
+                self, path, _StemHandler)
+
+        def server_close(self):
+            super(UnixStemServer, self).server_close()
+            try:
+                os.unlink(self.server_address)
+            except OSError:
+                pass
+
+
+class StemClient(object):
+    """
+    A client for StemServer and UnixStemServer that keeps its
+    connection open between calls. The address is a (host, port)
+    pair for TCP or a path for a Unix domain socket.
+    """
+
+    def __init__(self, address, timeout=None):
+        self.address = address
+        self.timeout = timeout
+        self._socket = None
+        self._stream = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _connect(self):
+        if self._socket is None:
+            if isinstance(self.address, tuple):
+                self._socket = socket.create_connection(self.address,
+                                                        self.timeout)
+                self._socket.setsockopt(socket.IPPROTO_TCP,
+                                        socket.TCP_NODELAY, 1)
+            else:
+                self._socket = socket.socket(socket.AF_UNIX)
+                self._socket.settimeout(self.timeout)
+                self._socket.connect(self.address)
+            self._stream = self._socket.makefile('rb')
+
+        return self._socket
+
+    def close(self):
+        """
+        Close the connection to the server.
+        """
+        if self._socket is not None:
+            self._stream.close()
+            self._socket.close()
+            self._socket = None
+            self._stream = None
+
+    def stem_batches(self, batches):
+        """
+        Send several batches of words at once and return a list
+        with the stems of each batch.
+        """
+        batches = list(batches)
+        data = b''.join(encode_batch(words) for words in batches)
+        connection = self._connect()
+
+        # Send from another thread when pipelining, so that the
+        # server is never stuck writing responses nobody reads.
+        sender = None
+        if len(batches) > 1:
+            sender = threading.Thread(target=connection.sendall, args=(data,))
+            sender.daemon = True
+
+        try:
+            if sender is None:
+                connection.sendall(data)
+            else:
+                sender.start()
+
+            results = []
+            for _ in batches:
+                payload = read_frame(self._stream)
+                if payload is None:
+                    raise ConnectionError('server closed the connection')
+                results.append(decode_batch(payload))
+        except Exception:
+            self.close()
+            raise
+        finally:
+            if sender is not None and sender.ident is not None:
+                sender.join()
+
+        return results
+
+    def stem_many(self, words):
+        """
+        Stem a batch of words and return their stems in order.
+        """
+        return self.stem_batches([list(words)])[0]
+
+    def stem(self, word):
+        """
+        Stem a single word.
+        """
+        return self.stem_many([word])[0]
+
+
+def main(argv=None):
+    """
+    Run a stemming server until interrupted.
+    """
+    parser = argparse.ArgumentParser(description='Serve Porter2 stems.')
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--tcp', metavar='HOST:PORT',
+                       help='listen on a TCP address')
+    group.add_argument('--unix', metavar='PATH',
+                       help='listen on a Unix domain socket')
+    parser.add_argument('-c', '--cache-size', type=int, default=65536,
+                        help='number of stems in the shared cache')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='worker processes for large batches')
+    parser.add_argument('-o', '--overrides', metavar='FILE',
+                        help="file of words to protect or 'word,stem' "
+                             "overrides, one per line")
+    args = parser.parse_args(argv)
+
+    overrides = read_overrides(args.overrides) if args.overrides else None
+    if args.tcp:
+        host, _, port = args.tcp.rpartition(':')
+        server = StemServer((host or 'localhost', int(port)),
+                            args.cache_size or None, args.workers, overrides)
+    else:
+        server = UnixStemServer(args.unix, args.cache_size or None,
+                                args.workers, overrides)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    main()
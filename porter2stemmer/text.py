@@ -0,0 +1,121 @@
+"""
+Tokenize, normalize and stem running text in one pass.
+"""
+
+import re
+
+from .porter2stemmer import Porter2Stemmer
+
+
+# Runs of letters and digits, with apostrophes allowed inside
+# words and after a final s, as in "don't" and "dogs'".
+_TOKEN = re.compile(r"[^\W_]+(?:'[^\W_]+)*(?:(?<=[sS])'(?![^\W_]))?")
+
+# The spec treats these as apostrophes.
+_APOSTROPHES = dict.fromkeys(map(ord, u'‘’‛'), u"'")
+
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because
+been before being below between both but by can could did do does doing
+down during each few for from further had has have having he her here hers
+herself him himself his how i if in into is it its itself just me more most
+my myself no nor not now of off on once only or other our ours ourselves
+out over own same she should so some such than that the their theirs them
+themselves then there these they this those through to too under until up
+very was we were what when where which while who whom why will with would
+you your yours yourself yourselves
+""".split())
+
+
+def normalize(text):
+    """
+    Replace typographic apostrophes with plain ones.
+    """
+    return text.translate(_APOSTROPHES)
+
+
+def split_unfinished(text):
+    """
+    Split text that may carry on in a following chunk into the
+    part whose words are all complete and the unfinished word at
+    its end, if there is one.
+    """
+    # Words are made of letters, digits and apostrophes, so back
+    # up over any run of those.
+    end = len(text)
+    while end and (text[end - 1] == "'" or _TOKEN.match(text[end - 1])):
+        end -= 1
+
+    return text[:end], text[end:]
+
+
+def tokenize(text):
+    """
+    Return the lowercased words of the text, with
+    typographic apostrophes replaced by plain ones.
+    """
+    return _TOKEN.findall(normalize(text).lower())
+
+
+class TextStemmer(object):
+    """
+    Stem the words of running text. Words are split out with
+    a regular expression, lowercased and stripped of stopwords
+    before stemming, and the stems can come with the character
+    offsets of their words for highlighting.
+    """
+
+    def __init__(self, stemmer=None, stopwords=None):
+        """
+        Pass stopwords, such as STOPWORDS, to leave those
+        lowercase words out of the results.
+        """
+        self.stemmer = stemmer or Porter2Stemmer(cache_size=65536)
+        self.stopwords = frozenset(stopwords or ())
+
+    def _stems(self, text, base):
+        """
+        Yield (stem, start, end) for each word of the text,
+        offsetting positions by base.
+        """
+        stem = self.stemmer.stem
+        stopwords = self.stopwords
+
+        for match in _TOKEN.finditer(text):
+            word = match.group().lower()
+            if word not in stopwords:
+                yield stem(word), base + match.start(), base + match.end()
+
+    def stem_text(self, text, offsets=False):
+        """
+        Return the stems of the words in the text as a list,
+        or as (stem, start, end) tuples if offsets is true.
+        """
+        stems = self._stems(normalize(text), 0)
+        if offsets:
+            return list(stems)
+
+        return [stemmed for stemmed, start, end in stems]
+
+    def iter_stem_text(self, chunks, offsets=False):
+        """
+        Lazily stem text arriving in chunks, such as the lines of
+        a file, yielding stems or (stem, start, end) tuples with
+        offsets counted from the start of the stream. Words split
+        between chunks are put back together.
+        """
+        pending = u''
+        base = 0
+
+        for chunk in chunks:
+            # The last word may carry on into the next chunk, so
+            # only stem the words before it.
+            text, pending = split_unfinished(pending + normalize(chunk))
+
+            for result in self._stems(text, base):
+                yield result if offsets else result[0]
+
+            base += len(text)
+
+        for result in self._stems(pending, base):
+            yield result if offsets else result[0]
@@ -0,0 +1,74 @@
+"""
+Stem whole NumPy arrays of words. Requires numpy, which can be
+installed with the package's numpy extra.
+
+Each distinct word is considered once. Words the algorithm
+cannot change are picked out with vectorized tests on a
+fixed-width character matrix, and only the rest are passed to
+the stemmer one at a time.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .porter2stemmer import Porter2Stemmer
+
+
+# A word ending in any other character is left alone by every
+# step, unless it is an exception, starts with an apostrophe or
+# contains a Y, which the last step lowercases.
+_CHANGEABLE_ENDINGS = list(u"sdgyYlirnmect'")
+
+
+def _last_and_first(words, lengths):
+    """
+    Return the last and first characters of each word of
+    a unicode array, using a view of it as a matrix with
+    one row of characters per word.
+    """
+    width = words.dtype.itemsize // 4
+    matrix = numpy.ascontiguousarray(words).view('U1').reshape(len(words),
+                                                               width)
+    rows = numpy.arange(len(words))
+    return (matrix[rows, numpy.maximum(lengths - 1, 0)], matrix[:, 0])
+
+
+def stem_array(words, stemmer=None):
+    """
+    Stem an array of words, or anything numpy.asarray accepts,
+    and return an array of stems of the same shape. Unicode and
+    object arrays give unicode arrays; byte string arrays are
+    treated as UTF-8 and give byte string arrays.
+    """
+    if numpy is None:
+        raise ImportError('stem_array requires numpy')
+
+    stemmer = stemmer or Porter2Stemmer()
+    words = numpy.asarray(words)
+
+    if words.dtype.kind == 'S':
+        stems = stem_array(numpy.char.decode(words, 'utf-8'), stemmer)
+        return numpy.char.encode(stems, 'utf-8')
+    elif words.dtype.kind != 'U':
+        words = words.astype(str)
+
+    if words.size == 0:
+        return words.copy()
+
+    uniques, inverse = numpy.unique(words.ravel(), return_inverse=True)
+    lengths = numpy.char.str_len(uniques)
+    last, first = _last_and_first(uniques, lengths)
+
+    unchangeable = ~numpy.isin(last, _CHANGEABLE_ENDINGS) & (first != u"'")
+    unchangeable &= numpy.char.find(uniques, u'Y') < 0
+    unchanged = (lengths <= 2) | unchangeable
+    unchanged &= ~numpy.isin(uniques, list(stemmer.exceptions))
+
+    stems = uniques.tolist()
+    stem = stemmer.stem
+    for index in numpy.flatnonzero(~unchanged).tolist():
+        stems[index] = stem(stems[index])
+
+    return numpy.array(stems, dtype=str)[inverse].reshape(words.shape)
@@ -36,7 +36,18 @@ setup(
     package_dir={'porter2stemmer':
                  'porter2stemmer'},
     include_package_data=True,
+    entry_points={
+        'console_scripts': [
+            'porter2stemmer=porter2stemmer.cli:main',
+        ],
+    },
+    python_requires='>=3.7',
     install_requires=requirements,
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['pandas'],
+        'arrow': ['pyarrow'],
+    },
     license="BSD",
     zip_safe=False,
     keywords='porter2stemmer',
@@ -45,12 +56,11 @@ setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: BSD License',
         'Natural Language :: English',
-        "Programming Language :: Python :: 2",
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
     ],
     test_suite='tests',
     tests_require=test_requirements
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_aio
+----------------------------------
+
+Tests for `porter2stemmer.aio` module.
+"""
+import asyncio
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.aio import AsyncStemmer
+
+
+class TestAsyncStemmer(unittest.TestCase):
+
+    def setUp(self):
+        with open('tests/porter2_stemmed.csv') as test_cases:
+            self.words = [line.split(',')[0] for line in test_cases]
+        self.expected = Porter2Stemmer().stem_many(self.words)
+
+    def test_concurrent_requests_are_batched(self):
+        stemmer = AsyncStemmer(max_batch_size=32, max_delay=0.01)
+
+        async def run():
+            return await asyncio.gather(*[stemmer.stem(w)
+                                          for w in self.words])
+
+        self.assertEqual(asyncio.run(run()), self.expected)
+
+        metrics = stemmer.metrics()
+        self.assertEqual(metrics['requests'], len(self.words))
+        self.assertEqual(metrics['words'], len(self.words))
+        self.assertLess(metrics['batches'], len(self.words))
+        self.assertEqual(metrics['queue_depth'], 0)
+
+    def test_backpressure_limits_queue(self):
+        stemmer = AsyncStemmer(max_batch_size=8, max_delay=0.001,
+                               max_pending=10)
+
+        async def run():
+            chunks = [self.words[i:i + 4]
+                      for i in range(0, len(self.words), 4)]
+            results = await asyncio.gather(*[stemmer.stem_batch(chunk)
+                                             for chunk in chunks])
+            return [stem for result in results for stem in result]
+
+        self.assertEqual(asyncio.run(run()), self.expected)
+        self.assertLessEqual(stemmer.metrics()['max_queue_depth'], 10)
+
+    def test_overrides(self):
+        stemmer = AsyncStemmer(overrides={'running': 'running'})
+        words = ['running', 'cats']
+
+        self.assertEqual(asyncio.run(stemmer.stem_batch(words)),
+                         ['running', 'cat'])
+        self.assertEqual(asyncio.run(AsyncStemmer().stem_batch(words)),
+                         ['run', 'cat'])
+
+    def test_empty_batch(self):
+        self.assertEqual(asyncio.run(AsyncStemmer().stem_batch([])), [])
+
+if __name__ == '__main__':
+    unittest.main()
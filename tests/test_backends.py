@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_backends
+----------------------------------
+
+Tests for `porter2stemmer.backends` module.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.backends import (Backend, CompiledBackend, PythonBackend,
+                                     SAMPLE_WORDS, Stemmer, TableBackend)
+from porter2stemmer.mapped import compile_stem_table
+
+
+class BrokenBackend(Backend):
+
+    name = 'broken'
+
+    def load(self, stemmer):
+        return lambda word: word
+
+
+class CountingBackend(PythonBackend):
+
+    name = 'counting'
+
+    def __init__(self):
+        self.loads = 0
+
+    def load(self, stemmer):
+        self.loads += 1
+        return super(CountingBackend, self).load(stemmer)
+
+
+class ClosingTableBackend(TableBackend):
+
+    def __init__(self, path):
+        super(ClosingTableBackend, self).__init__(path)
+        self.tables = []
+
+    def load(self, stemmer):
+        stem = super(ClosingTableBackend, self).load(stemmer)
+        self.tables.append(stem.__self__)
+        return stem
+
+
+class TestStemmer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.directory, 'cache',
+                                       'backends.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def stemmer(self, **kwargs):
+        stemmer = Stemmer(cache_path=self.cache_path, **kwargs)
+        stemmer.sample_size = 1000
+        return stemmer
+
+    def test_stems_like_porter2stemmer(self):
+        stemmer = self.stemmer()
+        reference = Porter2Stemmer()
+
+        self.assertEqual(stemmer.stem('running'), 'run')
+        self.assertIn(stemmer.backend.name, ['python', 'compiled'])
+        self.assertEqual(stemmer.stem_many(SAMPLE_WORDS),
+                         reference.stem_many(SAMPLE_WORDS))
+
+    def test_skips_incorrect_backends(self):
+        stemmer = self.stemmer(backends=[BrokenBackend(), PythonBackend()])
+
+        self.assertEqual(stemmer.select(), 'python')
+        self.assertLess(stemmer.results['broken']['conformance'], 1.0)
+        self.assertEqual(stemmer.results['python']['conformance'], 1.0)
+
+    def test_compiled_backend_follows_overrides(self):
+        reference = Porter2Stemmer()
+        stemmer = self.stemmer(stemmer=reference, backends=[CompiledBackend()])
+
+        self.assertEqual(stemmer.select(), 'compiled')
+        reference.add_overrides({'running': 'running'})
+        self.assertEqual(stemmer.stem('running'), 'running')
+
+    def test_falls_back_to_python(self):
+        stemmer = self.stemmer(backends=[BrokenBackend()])
+
+        self.assertEqual(stemmer.select(), 'python')
+        self.assertEqual(stemmer.stem('running'), 'run')
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_reuses_cached_choice(self):
+        self.assertEqual(self.stemmer(backends=[CountingBackend()]).select(),
+                         'counting')
+        with open(self.cache_path) as cache:
+            self.assertEqual(list(json.load(cache).values()), ['counting'])
+
+        backend = CountingBackend()
+        stemmer = self.stemmer(backends=[backend])
+        self.assertEqual(stemmer.select(), 'counting')
+        self.assertIsNone(stemmer.results)
+        self.assertEqual(backend.loads, 1)
+
+    def test_table_backend(self):
+        table = os.path.join(self.directory, 'stems.p2st')
+        compile_stem_table(SAMPLE_WORDS, table)
+        stemmer = self.stemmer(table=table)
+
+        self.assertEqual(stemmer.stem('generously'), 'generous')
+        self.assertIn('table', stemmer.results)
+
+    def test_rejects_tables_from_other_stemmers(self):
+        table = os.path.join(self.directory, 'stems.p2st')
+        compile_stem_table(SAMPLE_WORDS + ['running'], table,
+                           Porter2Stemmer(overrides={'running': 'xx'}))
+        stemmer = self.stemmer(table=table)
+
+        self.assertEqual(stemmer.stem('running'), 'run')
+        self.assertNotIn('table', stemmer.results)
+
+        with open(table, 'r+b') as old:
+            old.write(b'P2ST\x01\x00')
+        self.assertFalse(TableBackend(table).available(Porter2Stemmer()))
+
+    def test_benchmark_closes_tables(self):
+        table = os.path.join(self.directory, 'stems.p2st')
+        compile_stem_table(SAMPLE_WORDS, table)
+        backend = ClosingTableBackend(table)
+        stemmer = self.stemmer(backends=[backend])
+
+        self.assertEqual(stemmer.select(), 'table')
+        self.assertEqual(len(backend.tables), 2)
+        self.assertTrue(backend.tables[0]._map.closed)
+        self.assertFalse(backend.tables[1]._map.closed)
+
+    def test_overrides_rule_out_tables(self):
+        table = os.path.join(self.directory, 'stems.p2st')
+        compile_stem_table(SAMPLE_WORDS, table)
+        stemmer = self.stemmer(stemmer=Porter2Stemmer(overrides={'cats': 'x'}),
+                               table=table)
+
+        self.assertEqual(stemmer.stem('cats'), 'x')
+        self.assertNotIn('table', stemmer.results)
+
+        stemmer = self.stemmer(stemmer=Porter2Stemmer(overrides={'cats': 'x'}),
+                               backends=[TableBackend(table)])
+        self.assertEqual(stemmer.select(), 'python')
+        self.assertEqual(stemmer.stem('cats'), 'x')
+
+if __name__ == '__main__':
+    unittest.main()
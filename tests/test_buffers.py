@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_buffers
+----------------------------------
+
+Tests for `porter2stemmer.buffers` module.
+"""
+import re
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.buffers import BytesStemmer
+
+
+class TestBytesStemmer(unittest.TestCase):
+
+    def setUp(self):
+        self.stemmer = BytesStemmer()
+        self.buffer = u'running cats na\xefvet\xe9 running generously'.encode(
+            'utf-8')
+        self.offsets = [match.span()
+                        for match in re.finditer(br'\S+', self.buffer)]
+        self.expected = [b'run', b'cat',
+                         Porter2Stemmer().stem(u'na\xefvet\xe9').encode('utf-8'),
+                         b'run', b'generous']
+
+    def test_stem(self):
+        self.assertEqual(self.stemmer.stem(b'running'), b'run')
+        self.assertEqual(self.stemmer.stem(bytearray(b'happily')), b'happili')
+        self.assertEqual(self.stemmer.stem(memoryview(b'ab')), b'ab')
+
+    def test_stem_tokens(self):
+        self.assertEqual(self.stemmer.stem_tokens(self.buffer, self.offsets),
+                         self.expected)
+        self.assertEqual(
+            self.stemmer.stem_tokens(memoryview(self.buffer), self.offsets),
+            self.expected)
+
+    def test_stem_into_bytearray(self):
+        output = bytearray(b'>')
+        spans = self.stemmer.stem_into(self.buffer, self.offsets, output, 1)
+
+        self.assertEqual([bytes(output[start:end]) for start, end in spans],
+                         self.expected)
+        self.assertEqual(bytes(output[:1]), b'>')
+        self.assertEqual(spans[-1][1], len(output))
+
+    def test_stem_into_fixed_buffer(self):
+        output = bytearray(64)
+        view = memoryview(output)
+        spans = self.stemmer.stem_into(self.buffer, self.offsets, view)
+
+        self.assertEqual(len(output), 64)
+        self.assertEqual([bytes(output[start:end]) for start, end in spans],
+                         self.expected)
+        self.assertRaises(ValueError, self.stemmer.stem_into, self.buffer,
+                          self.offsets, view[:10])
+        self.assertRaises(ValueError, self.stemmer.stem_into, self.buffer,
+                          self.offsets, bytearray(), 5)
+
+    def test_uses_stemmer_overrides(self):
+        stemmer = BytesStemmer(Porter2Stemmer(overrides={'running': 'runs'}))
+
+        self.assertEqual(stemmer.stem(b'running'), b'runs')
+
+    def test_follows_overrides_added_later(self):
+        stemmer = Porter2Stemmer()
+        bytes_stemmer = BytesStemmer(stemmer)
+        self.assertEqual(bytes_stemmer.stem(b'running'), b'run')
+
+        stemmer.add_overrides({'running': 'running', u'na\xefve': 'x'})
+        self.assertEqual(bytes_stemmer.stem(b'running'), b'running')
+        self.assertEqual(bytes_stemmer.stem_tokens(
+            u'running na\xefve'.encode('utf-8'), [(0, 7), (8, 14)]),
+            [b'running', b'x'])
+
+    def test_memo_is_bounded(self):
+        self.stemmer.memo_size = 2
+        for word in [b'cats', b'dogs', b'running', b'cats']:
+            self.stemmer.stem(word)
+
+        self.assertLessEqual(len(self.stemmer._stems), 2)
+        self.assertEqual(self.stemmer.stem(b'dogs'), b'dog')
+
+if __name__ == '__main__':
+    unittest.main()
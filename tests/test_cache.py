@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_cache
+----------------------------------
+
+Tests for `porter2stemmer.cache` module.
+"""
+import unittest
+from porter2stemmer.cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.info(), {'hits': 1, 'misses': 0,
+                                        'evictions': 1, 'size': 2,
+                                        'maxsize': 2})
+
+    def test_miss_returns_default(self):
+        cache = LRUCache(2)
+        self.assertEqual(cache.get('a', 'x'), 'x')
+        self.assertEqual(cache.info()['misses'], 1)
+
+    def test_rejects_empty_size(self):
+        self.assertRaises(ValueError, LRUCache, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_cli
+----------------------------------
+
+Tests for `porter2stemmer.cli` module.
+"""
+import gc
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from porter2stemmer.cli import main
+
+
+def run_cli(args, text):
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'porter2stemmer'] + args,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    output, _ = process.communicate(text.encode('utf-8'))
+    return process.returncode, output.decode('utf-8')
+
+
+class TestCli(unittest.TestCase):
+
+    def test_stems_text(self):
+        code, output = run_cli([], 'Running runners ran quickly.\n\nCats\n')
+
+        self.assertEqual(code, 0)
+        self.assertEqual(output, 'run runner ran quick\n\ncat\n')
+
+    def test_pairs_of_tokens(self):
+        code, output = run_cli(['--tokens', '--format', 'pairs'],
+                               'running\n\ngenerously\n')
+
+        self.assertEqual(code, 0)
+        self.assertEqual(output, 'running\trun\ngenerously\tgenerous\n')
+
+    def test_reads_files_with_workers(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'words.txt')
+            with open(path, 'w') as words:
+                words.write('running\ngenerously\ncats\nhappily\n')
+
+            code, output = run_cli(['-t', '-w', '2', path, '-'], 'knees\n')
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(output, 'run\ngenerous\ncat\nhappili\nknee\n')
+
+    def test_overrides(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'overrides.txt')
+            with open(path, 'w') as overrides:
+                overrides.write('# Keep these\nrunning\nmice,mouse\n')
+
+            for workers in ['1', '2']:
+                code, output = run_cli(['-o', path, '-w', workers],
+                                       'Running mice and cats\n')
+                self.assertEqual(code, 0)
+                self.assertEqual(output, 'running mouse and cat\n')
+        finally:
+            shutil.rmtree(directory)
+
+    def test_main_leaves_standard_streams_open(self):
+        stdin = io.TextIOWrapper(io.BytesIO(b'Running cats\n'))
+        stdout = io.TextIOWrapper(io.BytesIO())
+        with mock.patch.object(sys, 'stdin', stdin), \
+                mock.patch.object(sys, 'stdout', stdout):
+            self.assertEqual(main([]), 0)
+            gc.collect()
+
+        self.assertFalse(stdin.closed)
+        self.assertFalse(stdout.closed)
+        self.assertEqual(stdout.buffer.getvalue(), b'run cat\n')
+
+    def test_rejects_bad_arguments(self):
+        missing = os.path.join(tempfile.gettempdir(), 'missing', 'words.txt')
+        for args, message in [([missing], "can't open"),
+                              (['-b', '0'], '--buffer-size')]:
+            stderr = io.StringIO()
+            with mock.patch.object(sys, 'stderr', stderr):
+                with self.assertRaises(SystemExit) as raised:
+                    main(args)
+            self.assertEqual(raised.exception.code, 2)
+            self.assertIn(message, stderr.getvalue())
+
+    def test_long_lines_read_in_chunks(self):
+        text = "Running, cats' rock'n'roll's\n\nhappily generously" * 50
+        expected = run_cli([], text)
+
+        self.assertEqual(expected[1].count('\n'), 101)
+        for size in ['1', '3', '16']:
+            self.assertEqual(run_cli(['-b', size], text), expected)
+
+    def test_skips_apostrophe_only_tokens(self):
+        code, output = run_cli(['-t', '-f', 'pairs'], "''s\n'''\ndogs'\n")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(output, 's\ts\ndogs\tdog\n')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_columns
+----------------------------------
+
+Tests for `porter2stemmer.columns` module.
+"""
+import unittest
+from porter2stemmer import Porter2Stemmer
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from porter2stemmer.columns import stem_arrow, stem_series
+
+
+WORDS = ['running', 'runs', None, 'cats', 'running', 'cat']
+STEMS = ['run', 'run', None, 'cat', 'run', 'cat']
+
+
+def values(series):
+    return [None if pandas.isna(value) else value for value in series]
+
+
+@unittest.skipIf(pandas is None, 'pandas is not installed')
+class TestStemSeries(unittest.TestCase):
+
+    def test_stems_series(self):
+        series = pandas.Series(WORDS, index=list('abcdef'), name='words')
+        stems = stem_series(series)
+
+        self.assertEqual(str(stems.dtype), 'category')
+        self.assertEqual(list(stems.cat.categories), ['run', 'cat'])
+        self.assertEqual(values(stems), STEMS)
+        self.assertEqual(list(stems.index), list('abcdef'))
+        self.assertEqual(stems.name, 'words')
+
+    def test_categorical_and_empty_series(self):
+        series = pandas.Series(WORDS, dtype='category')
+        self.assertEqual(values(stem_series(series)), STEMS)
+        self.assertEqual(len(stem_series(pandas.Series([], dtype=object))), 0)
+
+    def test_stems_each_word_once(self):
+        calls = []
+
+        class Counting(Porter2Stemmer):
+            def stem(self, word):
+                calls.append(word)
+                return super(Counting, self).stem(word)
+
+        stem_series(pandas.Series(WORDS * 100), Counting())
+        self.assertEqual(sorted(calls), ['cat', 'cats', 'running', 'runs'])
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class TestStemArrow(unittest.TestCase):
+
+    def test_stems_string_array(self):
+        stems = stem_arrow(pyarrow.array(WORDS))
+
+        self.assertTrue(pyarrow.types.is_dictionary(stems.type))
+        self.assertEqual(stems.dictionary.to_pylist(), ['run', 'cat'])
+        self.assertEqual(stems.to_pylist(), STEMS)
+
+    def test_stems_dictionary_and_chunked_arrays(self):
+        array = pyarrow.array(WORDS).dictionary_encode()
+        self.assertEqual(stem_arrow(array).to_pylist(), STEMS)
+
+        chunked = pyarrow.chunked_array([WORDS[:3], WORDS[3:]])
+        stems = stem_arrow(chunked)
+        self.assertIsInstance(stems, pyarrow.ChunkedArray)
+        self.assertEqual(stems.to_pylist(), STEMS)
+
+if __name__ == '__main__':
+    unittest.main()
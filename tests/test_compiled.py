@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_compiled
+----------------------------------
+
+Tests for `porter2stemmer.compiled` module.
+"""
+import random
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.compiled import compile_stemmer, fast_stem
+from porter2stemmer.conformance import load_vocabulary
+
+
+class TestFastStem(unittest.TestCase):
+
+    def setUp(self):
+        self.stemmer = Porter2Stemmer()
+
+    def test_matches_stemmer_on_vocabulary(self):
+        for word, stemmed in load_vocabulary('tests/porter2_vocabulary.csv.gz'):
+            self.assertEqual(fast_stem(word), self.stemmer.stem(word), word)
+
+    def test_matches_stemmer_on_random_words(self):
+        letters = 'abcdegilmnorstuvyz'
+        rand = random.Random(19)
+        for _ in range(20000):
+            word = ''.join(rand.choice(letters)
+                           for _ in range(rand.randint(3, 12)))
+            if rand.random() < 0.1:
+                word = "'" + word + rand.choice(["'", "'s", "'s'"])
+            self.assertEqual(fast_stem(word), self.stemmer.stem(word), word)
+
+    def test_special_cases(self):
+        for word in ['skies', 'news', 'generously', 'inning', 'ab', "'tis",
+                     "dog's'", 'hopping', 'luxuriating', 'geology',
+                     'fluently', 'demonstrative', 'adoption', u'na\xefvet\xe9']:
+            self.assertEqual(fast_stem(word), self.stemmer.stem(word), word)
+
+    def test_compile_with_overrides(self):
+        stemmer = Porter2Stemmer(overrides={'running': 'running'})
+        compiled = compile_stemmer(stemmer)
+
+        self.assertEqual(compiled('running'), 'running')
+        self.assertEqual(compiled('jumping'), 'jump')
+        self.assertEqual(fast_stem('running'), 'run')
+
+        stemmer.add_overrides({'jumping': 'jumping'})
+        self.assertEqual(compiled('jumping'), 'jumping')
+
+if __name__ == '__main__':
+    unittest.main()
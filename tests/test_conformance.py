@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_conformance
+----------------------------------
+
+Tests for `porter2stemmer.conformance` module, and of every
+backend against the Snowball reference vocabulary.
+"""
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.conformance import (check_backend, format_report,
+                                        load_vocabulary)
+
+
+# The (word, expected stem) pairs of the vocabulary that
+# Porter2Stemmer is known to stem differently from the Snowball
+# reference. Remove pairs as the stemmer improves; never add any.
+KNOWN_MISMATCHES = set([('yyyy', 'yyyi')])
+
+
+class TestConformance(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pairs = load_vocabulary('tests/porter2_vocabulary.csv.gz')
+        cls.reference = check_backend(Porter2Stemmer().stem, cls.pairs)
+
+    def test_vocabulary_is_large(self):
+        self.assertGreater(len(self.pairs), 40000)
+
+    def test_reference_conformance(self):
+        mismatches = set((word, expected) for word, expected, actual
+                         in self.reference['mismatches'])
+        self.assertEqual(mismatches, KNOWN_MISMATCHES)
+
+    def test_report_counts_mismatches(self):
+        report = check_backend(lambda word: word, [('cats', 'cat')] +
+                               [('cat', 'cat')] * 40000)
+        line = format_report('identity', report)
+
+        self.assertIn('100.00% conformant', line)
+        self.assertIn('    1 mismatches', line)
+
+    def test_backends_match_reference(self):
+        backends = [(Porter2Stemmer(cache_size=1024).stem, False),
+                    (Porter2Stemmer().stem_many, True),
+                    (lambda words: Porter2Stemmer().iter_stem(words), True)]
+
+        for stem, batch in backends:
+            report = check_backend(stem, self.pairs, batch)
+            self.assertEqual(report['mismatches'],
+                             self.reference['mismatches'])
+
+    def test_check_backend_reports_mismatches(self):
+        report = check_backend(str.upper, [('abc', 'ABC'), ('def', 'de')])
+
+        self.assertEqual(report['words'], 2)
+        self.assertEqual(report['conformance'], 0.5)
+        self.assertEqual(report['mismatches'], [('def', 'de', 'DEF')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_documents
+----------------------------------
+
+Tests for `porter2stemmer.documents` module.
+"""
+import random
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.documents import StemmedDocument
+from porter2stemmer.text import STOPWORDS, tokenize
+
+
+class CountingStemmer(Porter2Stemmer):
+
+    def __init__(self):
+        super(CountingStemmer, self).__init__()
+        self.calls = []
+
+    def stem(self, word):
+        self.calls.append(word)
+        return super(CountingStemmer, self).stem(word)
+
+
+class TestStemmedDocument(unittest.TestCase):
+
+    def test_initial_text(self):
+        document = StemmedDocument(u'The cats were running.',
+                                   stopwords=STOPWORDS)
+
+        self.assertEqual(document.tokens, ['cats', 'running'])
+        self.assertEqual(document.stems, ['cat', 'run'])
+        self.assertEqual(document.counts, {'cat': 1, 'run': 1})
+        self.assertIn('cat', document)
+
+    def test_update_returns_delta(self):
+        document = StemmedDocument(u'cats running dogs')
+        added, removed = document.update(u'cats jumping runs dogs')
+
+        self.assertEqual(added, set(['jump']))
+        self.assertEqual(removed, set())
+        self.assertEqual(document.stems, ['cat', 'jump', 'run', 'dog'])
+
+        added, removed = document.update(u'cats dogs')
+        self.assertEqual(added, set())
+        self.assertEqual(removed, set(['jump', 'run']))
+        self.assertEqual(document.counts, {'cat': 1, 'dog': 1})
+
+    def test_stems_only_new_tokens(self):
+        stemmer = CountingStemmer()
+        document = StemmedDocument(u'one two three two one', stemmer)
+        self.assertEqual(sorted(stemmer.calls), ['one', 'three', 'two'])
+
+        del stemmer.calls[:]
+        document.update(u'one two three four two one three')
+        self.assertEqual(stemmer.calls, ['four'])
+
+        del stemmer.calls[:]
+        document.update(u'three one')
+        self.assertEqual(stemmer.calls, [])
+
+    def test_matches_restemming(self):
+        rand = random.Random(24)
+        vocabulary = ['cats', 'cat', 'running', 'runs', 'dogs', 'happily',
+                      'happy', 'generous', 'generously', 'news']
+        document = StemmedDocument()
+        present = set()
+
+        for _ in range(200):
+            tokens = list(document.tokens)
+            for _ in range(rand.randint(1, 3)):
+                position = rand.randint(0, len(tokens))
+                if tokens and rand.random() < 0.4:
+                    del tokens[position:position + rand.randint(1, 4)]
+                else:
+                    tokens[position:position] = rand.sample(vocabulary, 3)
+
+            added, removed = document.update(u' '.join(tokens))
+            stems = [Porter2Stemmer().stem(token)
+                     for token in tokenize(u' '.join(tokens))]
+
+            self.assertEqual(document.stems, stems)
+            self.assertEqual(added, set(stems) - present)
+            self.assertEqual(removed, present - set(stems))
+            present = set(stems)
+            self.assertEqual(sum(document.counts.values()), len(stems))
+
+if __name__ == '__main__':
+    unittest.main()
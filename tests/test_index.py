@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_index
+----------------------------------
+
+Tests for `porter2stemmer.index` module.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.index import StemIndex
+
+
+class CountingStemmer(Porter2Stemmer):
+
+    def __init__(self):
+        super(CountingStemmer, self).__init__()
+        self.calls = 0
+
+    def stem(self, word):
+        self.calls += 1
+        return super(CountingStemmer, self).stem(word)
+
+
+class TestStemIndex(unittest.TestCase):
+
+    def test_forms_and_frequencies(self):
+        index = StemIndex()
+        index.add_text('Running runs. The runner ran; running again.')
+        index.add_words(['runs', 'run'])
+
+        self.assertEqual(index.forms('run'),
+                         [('running', 2), ('runs', 2), ('run', 1)])
+        self.assertEqual(index.expand('runs'), ['running', 'runs', 'run'])
+        self.assertEqual(index.frequency('run'), 5)
+        self.assertIn('runner', index)
+        self.assertEqual(index.forms('missing'), [])
+
+    def test_stems_each_word_once(self):
+        stemmer = CountingStemmer()
+        index = StemIndex(stemmer)
+        index.add_words(['cats', 'cat', 'cats'])
+        index.add_words(['cats', 'dogs'])
+
+        self.assertEqual(stemmer.calls, 3)
+
+    def test_save_and_load(self):
+        index = StemIndex()
+        index.add_text(u'Na\xefve cats, generous cats and a generously '
+                       u'sized cat.')
+        directory = tempfile.mkdtemp()
+        try:
+            for name in ('index.json', 'index.json.gz'):
+                path = os.path.join(directory, name)
+                index.save(path)
+
+                stemmer = CountingStemmer()
+                loaded = StemIndex.load(path, stemmer)
+                self.assertEqual(sorted(loaded), sorted(index))
+                self.assertEqual(loaded.forms('cat'), index.forms('cat'))
+
+                loaded.add_words(['cats', 'generously'])
+                self.assertEqual(stemmer.calls, 0)
+                self.assertEqual(loaded.frequency('cat'), 4)
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_interning
+----------------------------------
+
+Tests for `porter2stemmer.interning` module.
+"""
+import threading
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.interning import InternedStemmer
+
+
+class TestInternedStemmer(unittest.TestCase):
+
+    def setUp(self):
+        self.stemmer = InternedStemmer()
+
+    def test_returns_shared_stems(self):
+        first = self.stemmer.stem('running')
+        second = self.stemmer.stem('runs')
+
+        self.assertEqual(first, 'run')
+        self.assertIs(first, second)
+        self.assertIs(self.stemmer.intern(''.join(['r', 'un'])), first)
+        self.assertEqual(len(self.stemmer), 1)
+
+    def test_ids_round_trip(self):
+        ids = self.stemmer.stem_ids(['running', 'cats', 'runs', 'cat'])
+
+        self.assertEqual(list(ids), [0, 1, 0, 1])
+        self.assertEqual(ids.typecode, 'I')
+        self.assertEqual(self.stemmer.stem_id('happily'), 2)
+        self.assertEqual(self.stemmer.strings(ids), ['run', 'cat', 'run', 'cat'])
+        self.assertEqual(self.stemmer.string(2), 'happili')
+        self.assertEqual(self.stemmer.id_of('cat'), 1)
+        self.assertRaises(KeyError, self.stemmer.id_of, 'dog')
+        self.assertEqual(list(self.stemmer), ['run', 'cat', 'happili'])
+        self.assertIn('run', self.stemmer)
+
+    def test_uses_stemmer(self):
+        stemmer = InternedStemmer(Porter2Stemmer(overrides={'mice': 'mouse'}))
+
+        self.assertEqual(stemmer.stem('mice'), 'mouse')
+        self.assertEqual(stemmer.stem_id('mice'), stemmer.id_of('mouse'))
+
+    def test_ids_are_unique_across_threads(self):
+        words = ['word%d' % number for number in range(2000)]
+
+        def work():
+            self.stemmer.stem_ids(words)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.stemmer), 2000)
+        self.assertEqual(sorted(self.stemmer.stem_ids(words)), list(range(2000)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_mapped
+----------------------------------
+
+Tests for `porter2stemmer.mapped` module.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.mapped import (MappedStemmer, compile_stem_table,
+                                   stemmer_fingerprint)
+
+
+class TestMappedStemmer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'stems.p2st')
+
+        with open('tests/porter2_stemmed.csv') as test_cases:
+            self.pairs = [line.strip().split(',') for line in test_cases]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_lookup(self):
+        words = [orig for orig, stemmed in self.pairs] + [u'na\xefvely']
+        self.assertEqual(compile_stem_table(words + words, self.path),
+                         len(words))
+
+        with MappedStemmer(self.path) as stemmer:
+            self.assertEqual(len(stemmer), len(words))
+            for orig, stemmed in self.pairs:
+                self.assertEqual(stemmer.lookup(orig), stemmed)
+            self.assertEqual(stemmer.lookup(u'na\xefvely'), u'na\xefv')
+            self.assertIsNone(stemmer.lookup('running'))
+            self.assertNotIn('running', stemmer)
+
+    def test_falls_back_to_stemmer(self):
+        compile_stem_table(['kneeling'], self.path)
+
+        with MappedStemmer(self.path) as stemmer:
+            self.assertEqual(stemmer.stem_many(['kneeling', 'running']),
+                             ['kneel', 'run'])
+
+    def test_records_stemmer_fingerprint(self):
+        stemmer = Porter2Stemmer(overrides={'kneeling': 'kneeling'})
+        compile_stem_table(['kneeling'], self.path, stemmer)
+
+        with MappedStemmer(self.path) as table:
+            self.assertEqual(table.fingerprint, stemmer_fingerprint(stemmer))
+            self.assertNotEqual(table.fingerprint, stemmer_fingerprint())
+
+    def test_empty_table(self):
+        compile_stem_table([], self.path)
+
+        with MappedStemmer(self.path) as stemmer:
+            self.assertEqual(len(stemmer), 0)
+            self.assertEqual(stemmer.stem('running'), 'run')
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as table:
+            table.write(b'not a stem table')
+
+        self.assertRaises(ValueError, MappedStemmer, self.path)
+
+if __name__ == '__main__':
+    unittest.main()
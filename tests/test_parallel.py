@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_parallel
+----------------------------------
+
+Tests for `porter2stemmer.parallel` module.
+"""
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.parallel import ParallelStemmer
+
+
+class TestParallelStemmer(unittest.TestCase):
+
+    def setUp(self):
+        with open('tests/porter2_stemmed.csv') as test_cases:
+            self.words = [line.split(',')[0] for line in test_cases]
+
+    def test_stem_many_keeps_order(self):
+        words = self.words * 3
+        expected = Porter2Stemmer().stem_many(words)
+
+        with ParallelStemmer(workers=2, chunk_size=7) as stemmer:
+            self.assertEqual(stemmer.stem_many(iter(words)), expected)
+            self.assertEqual(stemmer.stem_many([]), [])
+
+    def test_stem_documents(self):
+        documents = [self.words[i:i + 5] for i in range(0, 40, 5)]
+        expected = [Porter2Stemmer().stem_many(d) for d in documents]
+
+        with ParallelStemmer(workers=2, chunk_size=3) as stemmer:
+            self.assertEqual(stemmer.stem_documents(documents), expected)
+
+    def test_overrides_reach_workers(self):
+        overrides = {'running': 'running', 'mice': 'mouse'}
+
+        with ParallelStemmer(workers=2, chunk_size=1,
+                             overrides=overrides) as stemmer:
+            self.assertEqual(stemmer.stem_many(['running', 'mice', 'cats']),
+                             ['running', 'mouse', 'cat'])
+
+if __name__ == '__main__':
+    unittest.main()
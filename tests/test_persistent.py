@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_persistent
+----------------------------------
+
+Tests for `porter2stemmer.persistent` module.
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.persistent import PersistentCache
+
+
+class TestPersistentCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'stems.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_stems_carry_over_between_runs(self):
+        with PersistentCache(self.path) as cache:
+            stemmer = Porter2Stemmer(cache=cache)
+            self.assertEqual(stemmer.stem('running'), 'run')
+            self.assertEqual(stemmer.stem('running'), 'run')
+            self.assertEqual(cache.info()['hits'], 1)
+
+        with PersistentCache(self.path) as cache:
+            self.assertIn('running', cache)
+            self.assertEqual(Porter2Stemmer(cache=cache).stem('running'), 'run')
+            self.assertEqual(cache.info()['misses'], 0)
+
+    def test_concurrent_reader(self):
+        writer = PersistentCache(self.path)
+        reader = PersistentCache(self.path)
+        writer.put('cats', 'cat')
+        writer.flush()
+
+        self.assertNotIn('cats', reader)
+        self.assertEqual(reader.get('missing'), None)
+        with PersistentCache(self.path) as later:
+            self.assertIn('cats', later)
+        writer.close()
+        reader.close()
+
+    def test_flushes_in_batches(self):
+        cache = PersistentCache(self.path)
+        cache.flush_size = 2
+        cache.put('cats', 'cat')
+        cache.put('dogs', 'dog')
+        cache.put('cows', 'cow')
+
+        rows = sqlite3.connect(self.path).execute(
+            'SELECT COUNT(*) FROM stems').fetchone()[0]
+        self.assertEqual(rows, 2)
+        cache.close()
+
+    def test_compacts_least_recently_used(self):
+        with PersistentCache(self.path, maxsize=3) as cache:
+            cache.put('cats', 'cat')
+            cache.put('dogs', 'dog')
+        with PersistentCache(self.path, maxsize=3) as cache:
+            self.assertEqual(cache.get('cats'), 'cat')
+            cache.put('cows', 'cow')
+            cache.put('pigs', 'pig')
+
+        with PersistentCache(self.path, maxsize=3) as cache:
+            self.assertEqual(len(cache), 3)
+            self.assertNotIn('dogs', cache)
+            self.assertIn('cats', cache)
+
+    def test_overrides_of_cached_words(self):
+        with PersistentCache(self.path) as cache:
+            stemmer = Porter2Stemmer(cache=cache)
+            self.assertEqual(stemmer.stem('running'), 'run')
+            stemmer.add_overrides({'running': 'running'})
+            self.assertEqual(stemmer.stem('running'), 'running')
+            self.assertEqual(Porter2Stemmer(cache=cache).stem('running'),
+                             'run')
+
+        with PersistentCache(self.path) as cache:
+            stemmer = Porter2Stemmer(overrides={'cats': 'cats'}, cache=cache)
+            self.assertIn('running', cache)
+            self.assertEqual(stemmer.stem('running'), 'run')
+            self.assertEqual(stemmer.stem('cats'), 'cats')
+            self.assertNotIn('cats', cache)
+
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(len(cache), 1)
+
+if __name__ == '__main__':
+    unittest.main()
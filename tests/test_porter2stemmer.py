@@ -7,8 +7,13 @@ test_porter2stemmer
 
 Tests for `porter2stemmer` module.
 """
+import os
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
-from porter2stemmer import Porter2Stemmer
+from porter2stemmer import Porter2Stemmer, stem
 
 
 class TestPorter2stemmer(unittest.TestCase):
@@ -26,6 +31,164 @@ class TestPorter2stemmer(unittest.TestCase):
 
         test_cases.close()
 
+    def test_exceptional_forms(self):
+        stemmer = Porter2Stemmer()
+        cases = [('skies', 'sky'), ('dying', 'die'), ('news', 'news'),
+                 ('atlas', 'atlas'), ('innings', 'inning'),
+                 ('proceeded', 'proceed'), ('succeeds', 'succeed'),
+                 ('generously', 'generous'), ('communities', 'communiti'),
+                 ('arsenal', 'arsenal'), ('generate', 'generat'),
+                 ('ies', 'ie'), ('ties', 'tie'), ('cries', 'cri')]
+
+        for word, stemmed in cases:
+            self.assertEqual(stemmer.stem(word), stemmed)
+
+    def test_suffix_tables(self):
+        stemmer = Porter2Stemmer()
+        # Only the longest suffix counts: fluently ends in entli, which
+        # starts before R1, so the shorter li isn't tried either.
+        cases = [('geology', 'geolog'), ('archaeology', 'archaeolog'),
+                 ('relational', 'relat'), ('national', 'nation'),
+                 ('conditional', 'condit'), ('rationally', 'ration'),
+                 ('fluently', 'fluentli'), ('hopefulness', 'hope')]
+
+        for word, stemmed in cases:
+            self.assertEqual(stemmer.stem(word), stemmed)
+
+    def test_eed_only_in_r1(self):
+        stemmer = Porter2Stemmer()
+        cases = [('feeds', 'feed'), ('needs', 'need'), ('speeds', 'speed'),
+                 ('agreed', 'agre'), ('guaranteedly', 'guarante')]
+
+        for word, stemmed in cases:
+            self.assertEqual(stemmer.stem(word), stemmed)
+
+    def test_overrides(self):
+        stemmer = Porter2Stemmer(cache_size=16, overrides={'nasa': 'nasa'})
+        self.assertEqual(stemmer.stem('running'), 'run')
+        self.assertEqual(stemmer.stem('nasa'), 'nasa')
+
+        handle, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(handle, 'w') as overrides:
+                overrides.write('# Product names\nwindows\nrunning,running\n'
+                                '\nmice, mouse\n')
+            stemmer.load_overrides(path)
+        finally:
+            os.remove(path)
+
+        self.assertEqual(stemmer.stem('windows'), 'windows')
+        self.assertEqual(stemmer.stem('running'), 'running')
+        self.assertEqual(stemmer.stem('mice'), 'mouse')
+        self.assertEqual(stemmer.stem('nasa'), 'nasa')
+        self.assertEqual(Porter2Stemmer().stem('windows'), 'window')
+
+    def test_set_ys(self):
+        stemmer = Porter2Stemmer()
+
+        self.assertEqual(stemmer.set_ys('youth'), 'Youth')
+        self.assertEqual(stemmer.set_ys('boyish'), 'boYish')
+        self.assertEqual(stemmer.set_ys('sayyid'), 'saYyid')
+        self.assertEqual(stemmer.set_ys('happy'), 'happy')
+
+    def test_find_regions(self):
+        stemmer = Porter2Stemmer()
+
+        self.assertEqual(stemmer.find_regions('beautiful'), (5, 7))
+        self.assertEqual(stemmer.find_regions('animadversion'), (2, 4))
+        self.assertEqual(stemmer.find_regions('beauty'), (5, sys.maxsize))
+        self.assertEqual(stemmer.find_regions('sky'),
+                         (sys.maxsize, sys.maxsize))
+        self.assertEqual(stemmer.find_regions(u'na\xefve'),
+                         (3, sys.maxsize))
+
+    def test_stem_many(self):
+        stemmer = Porter2Stemmer()
+
+        with open('tests/porter2_stemmed.csv') as test_cases:
+            pairs = [line.strip().split(',') for line in test_cases]
+
+        words = [orig for orig, stemmed in pairs] * 2
+        expected = [stemmed for orig, stemmed in pairs] * 2
+
+        self.assertEqual(stemmer.stem_many(words), expected)
+        self.assertEqual(stemmer.stem_many(iter(words)), expected)
+        self.assertEqual(list(stemmer.iter_stem(words)), expected)
+        self.assertEqual(stemmer.stem_many([]), [])
+
+    def test_shared_stemmer_across_threads(self):
+        with open('tests/porter2_stemmed.csv') as test_cases:
+            pairs = [line.strip().split(',') for line in test_cases]
+
+        words = [orig for orig, stemmed in pairs]
+        expected = [stemmed for orig, stemmed in pairs]
+        shared = [Porter2Stemmer(), Porter2Stemmer(cache_size=16)]
+        failures = []
+
+        def worker(offset):
+            for i in range(1000):
+                stemmer = shared[i % 2]
+                j = (offset + i) % len(words)
+                stemmed = stemmer.stem(words[j])
+                if stemmed != expected[j] or stem(words[j]) != expected[j]:
+                    failures.append(words[j])
+
+        # Switch threads often to make interleaved calls likely.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(n * 7,))
+                       for n in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(failures, [])
+
+    def test_import_loads_only_the_stemmer(self):
+        script = ('import sys; before = set(sys.modules); '
+                  'import porter2stemmer; porter2stemmer.stem("running"); '
+                  'print(" ".join(sorted(set(sys.modules) - before)))')
+        loaded = subprocess.check_output([sys.executable, '-c', script])
+        loaded = set(loaded.decode('ascii').split())
+
+        self.assertIn('porter2stemmer.porter2stemmer', loaded)
+        for module in ['porter2stemmer.cache', 'porter2stemmer.parallel',
+                       'porter2stemmer.cli', 'porter2stemmer.mapped',
+                       're', 'threading', 'concurrent.futures']:
+            self.assertNotIn(module, loaded)
+
+    def test_lazy_attributes(self):
+        import porter2stemmer
+        from porter2stemmer.text import TextStemmer
+
+        self.assertIs(porter2stemmer.TextStemmer, TextStemmer)
+        self.assertIn('ParallelStemmer', dir(porter2stemmer))
+        self.assertRaises(AttributeError, getattr, porter2stemmer, 'missing')
+
+    def test_cached_stem(self):
+        stemmer = Porter2Stemmer(cache_size=2)
+
+        self.assertEqual(stemmer.stem('running'), 'run')
+        self.assertEqual(stemmer.stem('running'), 'run')
+        self.assertEqual(stemmer.stem('happily'), 'happili')
+        self.assertEqual(stemmer.stem('conspicuous'), 'conspicu')
+
+        info = stemmer.cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 3)
+        self.assertEqual(info['evictions'], 1)
+        self.assertEqual(info['size'], 2)
+
+        stemmer.cache_clear()
+        self.assertEqual(stemmer.cache_info()['size'], 0)
+
+    def test_uncached_stem_has_no_cache_info(self):
+        self.assertIsNone(Porter2Stemmer().cache_info())
+
     def tearDown(self):
         pass
 
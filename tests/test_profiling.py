@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_profiling
+----------------------------------
+
+Tests for `porter2stemmer.profiling` module.
+"""
+import json
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.conformance import load_vocabulary
+from porter2stemmer.profiling import ProfilingPorter2Stemmer
+
+
+class TestProfilingPorter2Stemmer(unittest.TestCase):
+
+    def test_stems_like_porter2stemmer(self):
+        words = [word for word, stemmed in
+                 load_vocabulary('tests/porter2_vocabulary.csv.gz')]
+
+        self.assertEqual(ProfilingPorter2Stemmer().stem_many(words),
+                         Porter2Stemmer().stem_many(words))
+
+    def test_records_steps_and_rules(self):
+        stemmer = ProfilingPorter2Stemmer()
+        for word in ['relational', 'conditional', 'cats', 'at']:
+            stemmer.stem(word)
+
+        snapshot = stemmer.snapshot()
+        self.assertEqual(snapshot['words'], 4)
+        self.assertEqual(snapshot['steps']['set_ys']['calls'], 3)
+        self.assertGreaterEqual(snapshot['steps']['set_ys']['seconds'], 0)
+        self.assertEqual(snapshot['rules']['replace_suffixes_3'],
+                         {'ational -> ate': 1, 'tional -> tion': 1})
+        self.assertEqual(snapshot['rules']['replace_suffixes_1'],
+                         {'s -> ': 1})
+        self.assertEqual(json.loads(stemmer.to_json()), snapshot)
+
+        stemmer.reset()
+        self.assertEqual(stemmer.snapshot(),
+                         {'words': 0, 'steps': {}, 'rules': {}})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_server
+----------------------------------
+
+Tests for `porter2stemmer.server` module.
+"""
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.server import (StemClient, StemServer, decode_batch,
+                                   encode_batch)
+
+
+def serve(server):
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+class TestStemServer(unittest.TestCase):
+
+    def setUp(self):
+        with open('tests/porter2_stemmed.csv') as test_cases:
+            self.words = [line.split(',')[0] for line in test_cases]
+        self.expected = Porter2Stemmer().stem_many(self.words)
+
+    def test_encoding_round_trip(self):
+        words = ['running', u'na\xefvely', '', 'cats']
+        frame = encode_batch(words)
+
+        self.assertEqual(decode_batch(frame[4:]), words)
+
+    def test_encode_rejects_long_words(self):
+        self.assertEqual(len(encode_batch(['a' * 65535])), 4 + 2 + 65535)
+        self.assertRaises(ValueError, encode_batch, ['a' * 65536])
+        self.assertRaises(ValueError, encode_batch, [u'\xef' * 40000])
+
+    def test_long_stems_close_connection(self):
+        server = StemServer(('localhost', 0), overrides={'x': 'x' * 65536})
+        errors = []
+        server.handle_error = lambda request, address: errors.append(address)
+        thread = serve(server)
+        try:
+            with StemClient(server.server_address) as client:
+                self.assertRaises(ValueError, client.stem, 'a' * 65536)
+                self.assertEqual(client.stem('running'), 'run')
+                self.assertRaises(ConnectionError, client.stem, 'x')
+            self.assertEqual(errors, [])
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_decode_rejects_malformed_payloads(self):
+        for payload in [b'\x00', b'\x00\x05ab', b'\x00\x01\xff']:
+            self.assertRaises(ValueError, decode_batch, payload)
+
+    def test_malformed_frame_closes_connection(self):
+        server = StemServer(('localhost', 0))
+        errors = []
+        server.handle_error = lambda request, address: errors.append(address)
+        thread = serve(server)
+        try:
+            for payload in [b'\x00', b'\x00\x01\xff']:
+                connection = socket.create_connection(server.server_address)
+                connection.sendall(b'\x00\x00\x00' +
+                                   bytes(bytearray([len(payload)])) + payload)
+                self.assertEqual(connection.recv(16), b'')
+                connection.close()
+
+            with StemClient(server.server_address) as client:
+                self.assertEqual(client.stem('running'), 'run')
+            self.assertEqual(errors, [])
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_tcp_pipelined_batches(self):
+        server = StemServer(('localhost', 0), cache_size=16)
+        thread = serve(server)
+        try:
+            with StemClient(server.server_address) as client:
+                batches = [self.words[:10], [], self.words[10:]]
+                self.assertEqual(client.stem_batches(batches),
+                                 [self.expected[:10], [],
+                                  self.expected[10:]])
+                self.assertEqual(client.stem('running'), 'run')
+
+            self.assertEqual(server.stemmer.cache_info()['size'], 16)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_overrides(self):
+        # Batches this large go to the worker processes.
+        words = ['running', 'cats'] * 2500
+        for workers in [1, 2]:
+            server = StemServer(('localhost', 0), workers=workers,
+                                overrides={'running': 'running'})
+            thread = serve(server)
+            try:
+                with StemClient(server.server_address) as client:
+                    self.assertEqual(client.stem_many(words),
+                                     ['running', 'cat'] * 2500)
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join()
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'needs Unix sockets')
+    def test_unix_socket(self):
+        from porter2stemmer.server import UnixStemServer
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'stem.sock')
+        server = UnixStemServer(path)
+        thread = serve(server)
+        try:
+            with StemClient(path) as client:
+                self.assertEqual(client.stem_many(self.words), self.expected)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main()
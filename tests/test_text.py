@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_text
+----------------------------------
+
+Tests for `porter2stemmer.text` module.
+"""
+import unittest
+from porter2stemmer.text import STOPWORDS, TextStemmer, tokenize
+
+
+TEXT = u'The dogs’ owners weren’t running; said O’Neil, 42 times.'
+
+
+class TestTextStemmer(unittest.TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize(TEXT),
+                         ['the', "dogs'", 'owners', "weren't", 'running',
+                          'said', "o'neil", '42', 'times'])
+
+    def test_stem_text(self):
+        stemmer = TextStemmer(stopwords=STOPWORDS)
+
+        self.assertEqual(stemmer.stem_text(TEXT),
+                         ['dog', 'owner', "weren't", 'run', 'said',
+                          "o'neil", '42', 'time'])
+
+        stems = stemmer.stem_text(TEXT, offsets=True)
+        self.assertEqual(stems[3], ('run', 25, 32))
+        self.assertEqual(TEXT[4:9], u'dogs’')
+        self.assertEqual(stems[0], ('dog', 4, 9))
+
+    def test_iter_stem_text_joins_split_words(self):
+        stemmer = TextStemmer()
+        expected = stemmer.stem_text(TEXT, offsets=True)
+
+        for size in range(1, 12):
+            chunks = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+            self.assertEqual(list(stemmer.iter_stem_text(chunks, True)),
+                             expected)
+
+        self.assertEqual(list(stemmer.iter_stem_text(['running ', 'cats'])),
+                         ['run', 'cat'])
+
+        text = u"rock'n'roll's o'neil's' dogs'"
+        chunks = [text[i:i + 1] for i in range(len(text))]
+        self.assertEqual(list(stemmer.iter_stem_text(chunks)),
+                         stemmer.stem_text(text))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_vectorized
+----------------------------------
+
+Tests for `porter2stemmer.vectorized` module.
+"""
+import unittest
+from porter2stemmer import Porter2Stemmer
+from porter2stemmer.conformance import load_vocabulary
+
+try:
+    import numpy
+    from porter2stemmer.vectorized import stem_array
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestStemArray(unittest.TestCase):
+
+    def test_matches_stem(self):
+        words = [word for word, stemmed in
+                 load_vocabulary('tests/porter2_vocabulary.csv.gz')]
+        words += ["'tis", 'ab', 'news', u'na\xefvet\xe9', '', 'Yak', 'sYnk',
+                  'Ya']
+        expected = Porter2Stemmer().stem_many(words)
+
+        self.assertEqual(stem_array(numpy.array(words)).tolist(), expected)
+
+    def test_keeps_shape_and_kind(self):
+        words = numpy.array([[b'running', b'cats'], [b'ab', b'running']])
+        stems = stem_array(words)
+
+        self.assertEqual(stems.dtype.kind, 'S')
+        self.assertEqual(stems.tolist(), [[b'run', b'cat'], [b'ab', b'run']])
+        self.assertEqual(stem_array(numpy.array([], dtype=str)).shape, (0,))
+
+    def test_uses_stemmer_overrides(self):
+        stemmer = Porter2Stemmer(overrides={'mice': 'mouse', 'ox': 'oxen'})
+
+        self.assertEqual(stem_array(['mice', 'ox', 'skies'], stemmer).tolist(),
+                         ['mouse', 'oxen', 'sky'])
+
+if __name__ == '__main__':
+    unittest.main()